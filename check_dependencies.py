@@ -128,7 +128,8 @@ def check_system_services():
     
     # Check camera service
     import os
-    video_devices = [f"/dev/video{i}" for i in range(50) if os.path.exists(f"/dev/video{i}")]
+    video_devices = [entry.path for entry in os.scandir('/dev')
+                     if entry.name.startswith('video') and entry.name[5:].isdigit()]
     if video_devices:
         print(f"✅ Video devices found: {len(video_devices)}")
     else:
@@ -3,12 +3,15 @@ I2S Microphone Integration for SPH0645
 Handles recording from SPH0645 I2S microphone on Raspberry Pi 5
 """
 
+import collections
 import time
 import threading
 import numpy as np
 from typing import Optional, Callable
 import logging
 
+from core.audio.levels import rms, LevelHistory
+
 # Try to import I2S-specific libraries
 try:
     import pyaudio
@@ -17,6 +20,33 @@ except ImportError:
     I2S_AVAILABLE = False
     print("⚠️ PyAudio not available - using mock I2S interface")
 
+# PortAudio host-API enumeration is slow on the Pi, so one PyAudio instance
+# is shared by device lookup and every recording session in the process
+_pyaudio_instance = None
+
+def _get_pyaudio():
+    """Get the shared PyAudio instance"""
+    global _pyaudio_instance
+    if _pyaudio_instance is None:
+        _pyaudio_instance = pyaudio.PyAudio()
+    return _pyaudio_instance
+
+# Input-capable devices, enumerated once per process and reused by every
+# I2SMicrophone so repeated lookups skip the PortAudio probe entirely
+_input_devices_cache = None
+
+def _get_input_devices():
+    """Get (index, info) pairs for all input-capable devices"""
+    global _input_devices_cache
+    if _input_devices_cache is None:
+        p = _get_pyaudio()
+        _input_devices_cache = []
+        for i in range(p.get_device_count()):
+            info = p.get_device_info_by_index(i)
+            if info['maxInputChannels'] > 0:
+                _input_devices_cache.append((i, info))
+    return _input_devices_cache
+
 class I2SMicrophone:
     def __init__(self, sample_rate: int = 44100, channels: int = 1, chunk_size: int = 1024):
         """
@@ -39,6 +69,7 @@ class I2SMicrophone:
         self.record_thread = None
         self.stop_event = threading.Event()
         self.sample_count = 0  # Track samples to ignore initial spike
+        self.overflow_count = 0  # PortAudio input overflows seen by the stream callback
         
         # Audio format settings for USB/I2S
         self.format = pyaudio.paInt16 if I2S_AVAILABLE else None  # 16-bit is more common for USB audio
@@ -52,42 +83,37 @@ class I2SMicrophone:
     def _find_i2s_device(self):
         """Find I2S or USB audio input device"""
         try:
-            p = pyaudio.PyAudio()
+            input_devices = _get_input_devices()
             
             # Look specifically for the I2S device (SPH0645) first
-            for i in range(p.get_device_count()):
-                info = p.get_device_info_by_index(i)
-                if info['maxInputChannels'] > 0:  # Input device
-                    device_name = info['name'].lower()
-                    # Look for the Google VoiceHAT/RPi I2S device
-                    if any(pattern in device_name for pattern in ['googlevoicehat', 'rpi', 'simple']):
-                        self.input_device_index = i
-                        self.sample_rate = 48000  # I2S standard rate
-                        self.format = pyaudio.paInt32  # I2S uses 32-bit
-                        self.channels = 2  # I2S is stereo (we'll use one channel)
-                        print(f"🎤 Found I2S device (SPH0645): {info['name']} (index {i})")
-                        break
+            for i, info in input_devices:
+                device_name = info['name'].lower()
+                # Look for the Google VoiceHAT/RPi I2S device
+                if any(pattern in device_name for pattern in ['googlevoicehat', 'rpi', 'simple']):
+                    self.input_device_index = i
+                    self.sample_rate = 48000  # I2S standard rate
+                    self.format = pyaudio.paInt32  # I2S uses 32-bit
+                    self.channels = 2  # I2S is stereo (we'll use one channel)
+                    print(f"🎤 Found I2S device (SPH0645): {info['name']} (index {i})")
+                    break
             
             # Fallback to USB audio if I2S not found
             if self.input_device_index is None:
-                for i in range(p.get_device_count()):
-                    info = p.get_device_info_by_index(i)
-                    if info['maxInputChannels'] > 0:  # Input device
-                        if 'maono' in info['name'].lower() or 'usb audio' in info['name'].lower():
-                            self.input_device_index = i
-                            print(f"🎤 Found USB audio device: {info['name']} (index {i})")
-                            # Use stereo for USB audio (will convert to mono if needed)
-                            self.channels = min(2, info['maxInputChannels'])
-                            # Use device's default sample rate
-                            self.sample_rate = int(info['defaultSampleRate'])
-                            break
+                for i, info in input_devices:
+                    if 'maono' in info['name'].lower() or 'usb audio' in info['name'].lower():
+                        self.input_device_index = i
+                        print(f"🎤 Found USB audio device: {info['name']} (index {i})")
+                        # Use stereo for USB audio (will convert to mono if needed)
+                        self.channels = min(2, info['maxInputChannels'])
+                        # Use device's default sample rate
+                        self.sample_rate = int(info['defaultSampleRate'])
+                        break
             
             if self.input_device_index is None:
                 # Use default input device as last resort
-                self.input_device_index = p.get_default_input_device_info()['index']
+                self.input_device_index = _get_pyaudio().get_default_input_device_info()['index']
                 print(f"🎤 Using default input device (index {self.input_device_index})")
                 
-            p.terminate()
             
         except Exception as e:
             print(f"❌ Error finding I2S device: {e}")
@@ -115,10 +141,22 @@ class I2SMicrophone:
         print("🎤 I2S microphone recording started")
         
     def _start_real_recording(self):
-        """Start real I2S recording using PyAudio"""
+        """Start real I2S recording using PyAudio callback mode"""
+        # PortAudio's thread only queues raw buffers; conversion and user
+        # callbacks run on record_thread so they can't stall the capture
+        chunks = collections.deque(maxlen=64)
+        chunk_ready = threading.Event()
+        
+        def stream_callback(in_data, frame_count, time_info, status):
+            if status & pyaudio.paInputOverflow:
+                self.overflow_count += 1
+            chunks.append(in_data)
+            chunk_ready.set()
+            return (None, pyaudio.paContinue)
+        
         def record_loop():
             try:
-                p = pyaudio.PyAudio()
+                p = _get_pyaudio()
                 
                 self.audio_stream = p.open(
                     format=self.format,
@@ -126,53 +164,19 @@ class I2SMicrophone:
                     rate=self.sample_rate,
                     input=True,
                     input_device_index=self.input_device_index,
-                    frames_per_buffer=self.chunk_size
+                    # In callback mode this is the callback block size, so it
+                    # stays one chunk; the bounded chunks deque now provides
+                    # the read-ahead the doubled blocking-mode buffer used to
+                    frames_per_buffer=self.chunk_size,
+                    stream_callback=stream_callback
                 )
                 
                 while not self.stop_event.is_set():
-                    try:
-                        # Read audio data
-                        data = self.audio_stream.read(self.chunk_size, exception_on_overflow=False)
-                        
-                        # Convert to numpy array (handle both I2S 32-bit and USB 16-bit)
-                        if self.format == pyaudio.paInt32:
-                            # I2S 32-bit data
-                            audio_np = np.frombuffer(data, dtype=np.int32)
-                            # Convert to 16-bit range for consistent processing
-                            audio_np = (audio_np / 65536).astype(np.int16)
-                        else:
-                            # Regular 16-bit data
-                            audio_np = np.frombuffer(data, dtype=np.int16)
-                        
-                        # If stereo, convert to mono by averaging channels
-                        if self.channels == 2 and len(audio_np) >= 2:
-                            # Take left channel only (SPH0645 is on left channel)
-                            audio_np = audio_np[0::2]  # Every other sample starting from 0
-                        
-                        # Skip first few samples (initialization noise)
-                        self.sample_count += 1
-                        if self.sample_count <= 3:
-                            continue
-                        
-                        # Store for later retrieval
-                        self.audio_data.append(audio_np)
-                        
-                        # Keep only last 10 seconds of audio
-                        max_chunks = int(10 * self.sample_rate / self.chunk_size)
-                        if len(self.audio_data) > max_chunks:
-                            self.audio_data.pop(0)
-                            
-                        # Call callbacks with new audio data
-                        for callback in self.callbacks:
-                            try:
-                                callback(audio_np, self.sample_rate)
-                            except Exception as e:
-                                print(f"❌ Audio callback error: {e}")
-                                
-                    except Exception as e:
-                        if not self.stop_event.is_set():
-                            print(f"❌ Audio read error: {e}")
-                        break
+                    if not chunk_ready.wait(timeout=0.5):
+                        continue
+                    chunk_ready.clear()
+                    while chunks:
+                        self._process_chunk(chunks.popleft())
                         
             except Exception as e:
                 print(f"❌ Failed to start I2S recording: {e}")
@@ -180,11 +184,50 @@ class I2SMicrophone:
                 if self.audio_stream:
                     self.audio_stream.stop_stream()
                     self.audio_stream.close()
-                p.terminate()
+                if self.overflow_count:
+                    print(f"⚠️ I2S input overflowed {self.overflow_count} times")
                 
         self.record_thread = threading.Thread(target=record_loop, daemon=True)
         self.record_thread.start()
         
+    def _process_chunk(self, data: bytes):
+        """Convert one captured buffer and hand it to the callbacks"""
+        # Convert to numpy array (handle both I2S 32-bit and USB 16-bit)
+        if self.format == pyaudio.paInt32:
+            # I2S 32-bit data
+            audio_np = np.frombuffer(data, dtype=np.int32)
+            # Convert to 16-bit range for consistent processing
+            # (integer shift - no float64 temporary per chunk)
+            audio_np = (audio_np >> 16).astype(np.int16)
+        else:
+            # Regular 16-bit data
+            audio_np = np.frombuffer(data, dtype=np.int16)
+        
+        # If stereo, convert to mono by averaging channels
+        if self.channels == 2 and len(audio_np) >= 2:
+            # Take left channel only (SPH0645 is on left channel)
+            audio_np = audio_np[0::2]  # Every other sample starting from 0
+        
+        # Skip first few samples (initialization noise)
+        self.sample_count += 1
+        if self.sample_count <= 3:
+            return
+        
+        # Store for later retrieval
+        self.audio_data.append(audio_np)
+        
+        # Keep only last 10 seconds of audio
+        max_chunks = int(10 * self.sample_rate / self.chunk_size)
+        if len(self.audio_data) > max_chunks:
+            self.audio_data.pop(0)
+            
+        # Call callbacks with new audio data
+        for callback in self.callbacks:
+            try:
+                callback(audio_np, self.sample_rate)
+            except Exception as e:
+                print(f"❌ Audio callback error: {e}")
+        
     def _start_mock_recording(self):
         """Start mock recording for testing without hardware"""
         def mock_record_loop():
@@ -232,14 +275,14 @@ class I2SMicrophone:
             
         # Get RMS of recent audio data
         recent_audio = np.concatenate(self.audio_data[-5:])  # Last ~5 chunks
-        rms = np.sqrt(np.mean(recent_audio.astype(np.float64) ** 2))
+        level_rms = rms(recent_audio)
         
         # Normalize to 0-1 range (adjust for USB microphone with noise floor ~0.7)
         # Subtract noise floor and scale appropriately
         noise_floor = 0.7
-        if rms > noise_floor:
+        if level_rms > noise_floor:
             # Scale from noise floor to reasonable max (e.g., 100)
-            normalized = min((rms - noise_floor) / 50.0, 1.0)  # Scale above noise floor
+            normalized = min((level_rms - noise_floor) / 50.0, 1.0)  # Scale above noise floor
         else:
             normalized = 0.0
         return normalized
@@ -285,7 +328,7 @@ def get_i2s_microphone() -> I2SMicrophone:
 
 def audio_level_callback(audio_data: np.ndarray, sample_rate: int):
     """Example callback to monitor audio levels"""
-    level = np.sqrt(np.mean(audio_data.astype(np.float64) ** 2))
+    level = rms(audio_data)
     if level > 5:  # Threshold above noise floor of ~0.7
         print(f"🔊 Audio detected: level {level:.1f}")
 
@@ -294,7 +337,9 @@ if __name__ == "__main__":
     print("🎤 Testing I2S Microphone...")
     
     mic = I2SMicrophone()
-    mic.add_callback(audio_level_callback)
+    # Collect levels during the run and print them once it finishes
+    history = LevelHistory(int(12 * mic.sample_rate / mic.chunk_size), threshold=5)
+    mic.add_callback(history)
     
     try:
         mic.start_recording()
@@ -305,12 +350,13 @@ if __name__ == "__main__":
             raw_rms = 0.0
             if mic.audio_data:
                 recent_audio = np.concatenate(mic.audio_data[-5:])
-                raw_rms = np.sqrt(np.mean(recent_audio.astype(np.float64) ** 2))
+                raw_rms = rms(recent_audio)
             print(f"Audio level: {level:.3f} (raw RMS: {raw_rms:.1f})")
             
     except KeyboardInterrupt:
         print("\n🛑 Stopping...")
     finally:
         mic.stop_recording()
+        history.report()
         
     print("✅ I2S microphone test complete")
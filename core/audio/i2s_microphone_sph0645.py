@@ -20,6 +20,8 @@ import tempfile
 import os
 from typing import Optional, Callable, List
 
+from core.audio.levels import rms, LevelHistory
+
 class I2SMicrophone:
     def __init__(self, sample_rate: int = 44100, chunk_size: int = 1024):
         """
@@ -122,17 +124,27 @@ class I2SMicrophone:
                 bytes_per_sample = 4  # 32-bit = 4 bytes
                 chunk_bytes = self.chunk_size * bytes_per_sample * self.channels
                 
+                # One read buffer reused for every chunk; arecord fills it in place
+                raw_buffer = bytearray(chunk_bytes)
+                raw_view = memoryview(raw_buffer)
+                # Little-endian int32 >> 16 is just the high int16 word of each sample
+                high_words = np.frombuffer(raw_buffer, dtype='<i2')[1::2]
+                
                 while not self.stop_event.is_set():
                     try:
-                        # Read chunk from arecord
-                        raw_data = process.stdout.read(chunk_bytes)
-                        if not raw_data:
+                        # Fill the buffer from arecord (pipe reads can be short)
+                        filled = 0
+                        while filled < chunk_bytes:
+                            n = process.stdout.readinto(raw_view[filled:])
+                            if not n:
+                                break
+                            filled += n
+                        if filled < chunk_bytes:
                             break
                             
-                        # Convert 32-bit to 16-bit for processing
-                        audio_32 = np.frombuffer(raw_data, dtype=np.int32)
-                        # Scale down from 32-bit to 16-bit range
-                        audio_16 = (audio_32 >> 16).astype(np.int16)
+                        # Scale down from 32-bit to 16-bit range (copied, since
+                        # the read buffer is reused for the next chunk)
+                        audio_16 = high_words.copy()
                         
                         # Store for later retrieval
                         self.audio_data.append(audio_16)
@@ -211,14 +223,14 @@ class I2SMicrophone:
             
         # Get RMS of recent audio data
         recent_audio = np.concatenate(self.audio_data[-5:])  # Last ~5 chunks
-        rms = np.sqrt(np.mean(recent_audio.astype(np.float64) ** 2))
+        level_rms = rms(recent_audio)
         
         # Normalize to 0-1 range for I2S microphone
         # I2S mics typically have much lower noise floor
         noise_floor = 10.0  # Estimate for SPH0645
-        if rms > noise_floor:
+        if level_rms > noise_floor:
             # Scale from noise floor to reasonable max (e.g., 1000 for 16-bit)
-            normalized = min((rms - noise_floor) / 1000.0, 1.0)
+            normalized = min((level_rms - noise_floor) / 1000.0, 1.0)
         else:
             normalized = 0.0
         return normalized
@@ -265,7 +277,7 @@ def get_i2s_microphone() -> I2SMicrophone:
 
 def audio_level_callback(audio_data: np.ndarray, sample_rate: int):
     """Example callback to monitor audio levels"""
-    level = np.sqrt(np.mean(audio_data.astype(np.float64) ** 2))
+    level = rms(audio_data)
     if level > 20:  # Threshold for I2S microphone
         print(f"🔊 Audio detected: level {level:.1f}")
 
@@ -282,7 +294,9 @@ if __name__ == "__main__":
     print()
     
     mic = I2SMicrophone()
-    mic.add_callback(audio_level_callback)
+    # Collect levels during the run and print them once it finishes
+    history = LevelHistory(int(12 * mic.sample_rate / mic.chunk_size), threshold=20)
+    mic.add_callback(history)
     
     try:
         mic.start_recording()
@@ -293,12 +307,13 @@ if __name__ == "__main__":
             raw_rms = 0.0
             if mic.audio_data:
                 recent_audio = np.concatenate(mic.audio_data[-5:])
-                raw_rms = np.sqrt(np.mean(recent_audio.astype(np.float64) ** 2))
+                raw_rms = rms(recent_audio)
             print(f"Audio level: {level:.3f} (raw RMS: {raw_rms:.1f})")
             
     except KeyboardInterrupt:
         print("\n🛑 Stopping...")
     finally:
         mic.stop_recording()
+        history.report()
         
     print("✅ I2S microphone test complete")
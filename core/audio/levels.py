@@ -0,0 +1,74 @@
+"""
+Audio level helpers shared by the microphone drivers
+"""
+
+import math
+import sys
+import numpy as np
+
+# Optional JIT for the int16 sum-of-squares (pip install numba)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _sum_squares(y):
+        # fastmath lets LLVM reorder the sum into a vectorised NEON/AVX reduction
+        acc = 0.0
+        for i in range(y.shape[0]):
+            v = float(y[i])
+            acc += v * v
+        return acc
+
+
+def rms(samples: np.ndarray) -> float:
+    """
+    Root-mean-square of a block of PCM samples
+    
+    Takes 16-bit PCM, which is what every driver hands out. The
+    sum-of-squares goes through a numba-compiled loop when numba is
+    installed. Without it the block stays in the integer domain: each
+    square fits in int32 and np.sum accumulates in int64, so only the
+    final sqrt is floating point.
+    """
+    if samples.size == 0:
+        return 0.0
+    if samples.dtype != np.int16:
+        raise TypeError(f"rms() expects int16 PCM, got {samples.dtype}")
+    if NUMBA_AVAILABLE:
+        sum_sq = _sum_squares(samples.ravel())
+    else:
+        sum_sq = int(np.square(samples, dtype=np.int32).sum())
+    return math.sqrt(sum_sq / samples.size)
+
+
+class LevelHistory:
+    """
+    Audio callback that records per-chunk RMS levels for reporting later
+    
+    Levels go into a preallocated float32 array from the recording thread,
+    so the hot path does no string formatting or stdout writes; call
+    report() once recording has stopped to print the chunks above threshold.
+    """
+    
+    def __init__(self, capacity: int, threshold: float):
+        self.levels = np.zeros(capacity, dtype=np.float32)
+        self.count = 0
+        self.threshold = threshold
+        
+    def __call__(self, audio_data: np.ndarray, sample_rate: int):
+        if self.count < self.levels.size:
+            self.levels[self.count] = rms(audio_data)
+            self.count += 1
+            
+    def report(self):
+        """Print every recorded chunk whose level exceeded the threshold"""
+        levels = self.levels[:self.count]
+        active = np.flatnonzero(levels > self.threshold)
+        if active.size:
+            sys.stdout.write("".join(
+                f"🔊 Audio detected: chunk {i} level {levels[i]:.1f}\n" for i in active))
+        print(f"📊 {active.size}/{self.count} chunks above level {self.threshold}")
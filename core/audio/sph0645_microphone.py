@@ -8,7 +8,8 @@ import numpy as np
 from typing import Optional, Callable, List
 import tempfile
 import os
-import wave
+
+from core.audio.levels import rms, LevelHistory
 
 class SPH0645Microphone:
     """SPH0645 I2S MEMS Microphone using direct ALSA recording"""
@@ -130,32 +131,28 @@ class SPH0645Microphone:
     def _read_latest_chunk(self) -> Optional[np.ndarray]:
         """Read the latest chunk from the recording file"""
         try:
-            with wave.open(self.temp_wav_file.name, 'rb') as wav_file:
-                frames = wav_file.getnframes()
-                sample_width = wav_file.getsampwidth()  # Should be 4 for 32-bit
-                
-                if frames < self.chunk_samples:
-                    return None
-                    
-                # Read the last chunk
-                start_frame = max(0, frames - self.chunk_samples)
-                wav_file.setpos(start_frame)
-                audio_data = wav_file.readframes(self.chunk_samples)
-                
-                if len(audio_data) == 0:
-                    return None
-                
-                # Convert to numpy array (32-bit signed integers)
-                audio_np = np.frombuffer(audio_data, dtype=np.int32)
-                
-                # Convert stereo to mono (take left channel - SPH0645 is on left)
-                if len(audio_np) >= 2:
-                    audio_np = audio_np[0::2]  # Every other sample starting from 0
-                
-                # Convert from 32-bit to 16-bit range for consistency
-                audio_np = (audio_np / 65536).astype(np.int16)
+            # arecord streams raw S32_LE frames after a 44-byte header, so the
+            # frame count follows from the file size and the last chunk can be
+            # memory-mapped in place instead of copied out through wave
+            frame_bytes = 4 * self.channels
+            frames = (os.stat(self.temp_wav_file.name).st_size - 44) // frame_bytes
+            
+            if frames < self.chunk_samples:
+                return None
                 
-                return audio_np
+            # Map just the last chunk
+            start_frame = frames - self.chunk_samples
+            chunk = np.memmap(self.temp_wav_file.name, dtype='<i4', mode='r',
+                              offset=44 + start_frame * frame_bytes,
+                              shape=(self.chunk_samples, self.channels))
+            
+            # Take left channel (SPH0645 is on left) and convert from 32-bit
+            # to 16-bit range for consistency. The shift stays in integers
+            # (no float64 temporary); astype copies off the mapping
+            audio_np = (chunk[:, 0] >> 16).astype(np.int16)
+            del chunk
+            
+            return audio_np
                 
         except Exception as e:
             # File might be locked or incomplete
@@ -197,12 +194,12 @@ class SPH0645Microphone:
             
         # Get RMS of recent audio data
         recent_audio = np.concatenate(self.audio_data[-5:])  # Last ~5 chunks
-        rms = np.sqrt(np.mean(recent_audio.astype(np.float64) ** 2))
+        level_rms = rms(recent_audio)
         
         # Normalize to 0-1 range  
         noise_floor = 100  # Adjust based on testing
-        if rms > noise_floor:
-            normalized = min((rms - noise_floor) / 1000.0, 1.0)  # Scale above noise floor
+        if level_rms > noise_floor:
+            normalized = min((level_rms - noise_floor) / 1000.0, 1.0)  # Scale above noise floor
         else:
             normalized = 0.0
         return normalized
@@ -218,7 +215,7 @@ class SPH0645Microphone:
 
 def audio_level_callback(audio_data: np.ndarray, sample_rate: int):
     """Example callback to monitor audio levels"""
-    level = np.sqrt(np.mean(audio_data.astype(np.float64) ** 2))
+    level = rms(audio_data)
     if level > 100:  # Adjust threshold as needed
         print(f"🔊 Audio detected: level {level:.1f}")
 
@@ -227,7 +224,9 @@ if __name__ == "__main__":
     print("🎤 Testing SPH0645 I2S Microphone...")
     
     mic = SPH0645Microphone()
-    mic.add_callback(audio_level_callback)
+    # Collect levels during the run and print them once it finishes
+    history = LevelHistory(int(22 / mic.chunk_duration), threshold=100)
+    mic.add_callback(history)
     
     try:
         mic.start_recording()
@@ -238,12 +237,13 @@ if __name__ == "__main__":
             raw_rms = 0.0
             if mic.audio_data:
                 recent_audio = np.concatenate(mic.audio_data[-5:])
-                raw_rms = np.sqrt(np.mean(recent_audio.astype(np.float64) ** 2))
+                raw_rms = rms(recent_audio)
             print(f"Audio level: {level:.3f} (raw RMS: {raw_rms:.1f})")
             
     except KeyboardInterrupt:
         print("\n🛑 Stopping...")
     finally:
         mic.stop_recording()
+        history.report()
         
     print("✅ SPH0645 microphone test complete")
@@ -4,16 +4,17 @@ Supports separate PIR sensors for CritterCam and NestCam
 """
 
 import time
+import queue
 import threading
 from datetime import datetime
 from typing import Callable, Optional, Dict
 
-# Try to import gpiozero for Pi 5 compatibility, fallback for development
+# Try to import lgpio for Pi 5 compatibility, fallback for development
 try:
-    from gpiozero import Button
+    import lgpio
     GPIO_AVAILABLE = True
 except ImportError:
-    print("⚠️  gpiozero not available - PIR detector in simulation mode")
+    print("⚠️  lgpio not available - PIR detector in simulation mode")
     GPIO_AVAILABLE = False
 
 class DualPIRMotionDetector:
@@ -30,7 +31,11 @@ class DualPIRMotionDetector:
         self.motion_callback = motion_callback
         self.running = False
         self.detection_threads = {}
-        self.pir_sensors = {}  # Will hold gpiozero Button objects
+        self.chip = None  # Single gpiochip handle shared by both sensors
+        self.pir_pins = []  # Claimed for BOTH_EDGES alerts
+        self._pin_cameras = {}  # gpio -> camera name
+        self._edges = queue.Queue()  # (camera_name, level) from the alert callbacks
+        self._edge_callbacks = []
         
         # PIR sensor configuration (optimized for AM312 sensors)
         self.sensors = {
@@ -54,17 +59,32 @@ class DualPIRMotionDetector:
             print("[DualPIRMotionDetector] Running in simulation mode")
     
     def _setup_gpio(self):
-        """Setup GPIO pins for both PIR sensors using gpiozero"""
+        """Open the gpiochip once and claim both PIR pins for edge alerts"""
         try:
+            self.chip = lgpio.gpiochip_open(0)
             for camera_name, config in self.sensors.items():
-                # Create gpiozero Button object for PIR sensor (pull_up=False for AM312)
-                pir_button = Button(config['gpio_pin'], pull_up=False, bounce_time=0.1)
-                self.pir_sensors[camera_name] = pir_button
+                # Pull-down for AM312 (active-high output)
+                lgpio.gpio_claim_alert(self.chip, config['gpio_pin'], lgpio.BOTH_EDGES, lgpio.SET_PULL_DOWN)
+                self.pir_pins.append(config['gpio_pin'])
+                self._pin_cameras[config['gpio_pin']] = camera_name
                 print(f"[DualPIRMotionDetector] ✓ {camera_name} PIR sensor on GPIO {config['gpio_pin']}")
                 
         except Exception as e:
             print(f"[DualPIRMotionDetector] ❌ GPIO setup failed: {e}")
     
+    def _read_states(self) -> Dict[str, bool]:
+        """Read the current level of both PIR sensors (status/testing only)"""
+        if not self.pir_pins:
+            return {camera_name: False for camera_name in self.sensors}
+        return {
+            camera_name: bool(lgpio.gpio_read(self.chip, config['gpio_pin']))
+            for camera_name, config in self.sensors.items()
+        }
+    
+    def _on_edge(self, chip, gpio, level, tick):
+        """lgpio alert callback - just hand the edge to the monitor thread"""
+        self._edges.put((self._pin_cameras[gpio], level))
+    
     def start_detection(self):
         """Start monitoring both PIR sensors"""
         if self.running:
@@ -73,15 +93,16 @@ class DualPIRMotionDetector:
             
         self.running = True
         
-        # Start detection thread for each camera
-        for camera_name in self.sensors.keys():
-            thread = threading.Thread(
-                target=self._monitor_pir_sensor, 
-                args=(camera_name,), 
-                daemon=True
-            )
-            thread.start()
-            self.detection_threads[camera_name] = thread
+        if GPIO_AVAILABLE and self.pir_pins:
+            self._edge_callbacks = [
+                lgpio.callback(self.chip, pin, lgpio.BOTH_EDGES, self._on_edge)
+                for pin in self.pir_pins
+            ]
+        
+        # One thread handles both sensors
+        thread = threading.Thread(target=self._monitor_pir_sensors, daemon=True)
+        thread.start()
+        self.detection_threads['all'] = thread
             
         print("[DualPIRMotionDetector] 🚨 Motion detection started for both cameras")
     
@@ -89,20 +110,26 @@ class DualPIRMotionDetector:
         """Stop monitoring PIR sensors"""
         self.running = False
         
-        if GPIO_AVAILABLE:
-            # Close gpiozero Button objects
-            for pir_sensor in self.pir_sensors.values():
-                pir_sensor.close()
-            self.pir_sensors.clear()
+        for edge_callback in self._edge_callbacks:
+            edge_callback.cancel()
+        self._edge_callbacks = []
+        
+        if GPIO_AVAILABLE and self.chip is not None:
+            try:
+                for pin in self.pir_pins:
+                    lgpio.gpio_free(self.chip, pin)
+                lgpio.gpiochip_close(self.chip)
+            except Exception as e:
+                print(f"[DualPIRMotionDetector] ⚠️ GPIO cleanup failed: {e}")
+            self.chip = None
+            self.pir_pins = []
             
         print("[DualPIRMotionDetector] Motion detection stopped")
     
-    def _monitor_pir_sensor(self, camera_name: str):
-        """Monitor a specific PIR sensor with edge detection for AM312"""
-        sensor_config = self.sensors[camera_name]
-        gpio_pin = sensor_config['gpio_pin']
-        
-        print(f"[DualPIRMotionDetector] Monitoring {camera_name} on GPIO {gpio_pin} (AM312 sensor)")
+    def _monitor_pir_sensors(self):
+        """Run edge detection for AM312 sensors on edges delivered by lgpio alerts"""
+        for camera_name, config in self.sensors.items():
+            print(f"[DualPIRMotionDetector] Monitoring {camera_name} on GPIO {config['gpio_pin']} (AM312 sensor)")
         
         # Debug counter for periodic state reporting
         debug_counter = 0
@@ -110,73 +137,83 @@ class DualPIRMotionDetector:
         while self.running:
             try:
                 if GPIO_AVAILABLE:
-                    pir_sensor = self.pir_sensors.get(camera_name)
-                    if pir_sensor:
-                        current_state = pir_sensor.is_pressed
-                    else:
-                        current_state = False
+                    # Both lines are waited on together; the thread sleeps
+                    # until an edge arrives (1 s timeout to notice stop)
+                    try:
+                        camera_name, level = self._edges.get(timeout=1.0)
+                    except queue.Empty:
+                        continue
+                    debug_counter += 1
+                    self._process_sensor_state(camera_name, bool(level), debug_counter)
                 else:
                     # Simulation mode - random motion every 30-60 seconds
                     import random
-                    current_state = random.random() < 0.001  # Very low probability per loop
-                
-                # Debug: Report current state every 10 seconds
-                debug_counter += 1
-                if debug_counter % 100 == 0:  # Every ~10 seconds (100 * 0.1s sleep)
-                    state_name = "HIGH" if current_state else "LOW"
-                    print(f"[DualPIRMotionDetector] 🔍 {camera_name} state: {state_name} (last_state: {sensor_config['last_state']})")
-                
-                # Edge detection: trigger on LOW to HIGH transition (motion start)
-                # TEMP: Also trigger HIGH to LOW for testing stuck sensor
-                motion_detected = False
-                
-                if current_state and not sensor_config['last_state']:
-                    # Normal LOW→HIGH transition (motion detected)
-                    motion_detected = True
-                    motion_type = "motion_start"
-                elif not current_state and sensor_config['last_state']:
-                    # HIGH→LOW transition (motion ended) - temporary for debugging
-                    motion_detected = True
-                    motion_type = "motion_end"
-                
-                if motion_detected:
-                    current_time = time.time()
+                    debug_counter += 1
+                    for camera_name in self.sensors:
+                        current_state = random.random() < 0.001  # Very low probability per loop
+                        self._process_sensor_state(camera_name, current_state, debug_counter)
                     
-                    # Check cooldown period
-                    if current_time - sensor_config['last_detection'] > sensor_config['cooldown']:
-                        sensor_config['last_detection'] = current_time
-                        
-                        timestamp = datetime.now()
-                        print(f"[DualPIRMotionDetector] 🚨 {motion_type.upper()} on {camera_name} at {timestamp.strftime('%H:%M:%S')} (AM312)")
-                        
-                        # Create motion event
-                        motion_event = {
-                            'timestamp': timestamp.isoformat(),
-                            'camera_name': camera_name,
-                            'sensor_type': 'AM312_PIR',
-                            'detection_method': 'hardware_motion_sensor',
-                            'trigger_type': 'pir_motion',
-                            'gpio_pin': gpio_pin,
-                            'motion_type': motion_type
-                        }
-                        
-                        # Trigger callback
-                        if self.motion_callback:
-                            try:
-                                self.motion_callback(camera_name, motion_event)
-                            except Exception as e:
-                                print(f"[DualPIRMotionDetector] ❌ Callback error for {camera_name}: {e}")
-                
-                # Update last state for edge detection
-                sensor_config['last_state'] = current_state
-                
-                # Small delay to prevent excessive CPU usage
-                time.sleep(0.1)
+                    # Small delay to prevent excessive CPU usage
+                    time.sleep(0.1)
                 
             except Exception as e:
-                print(f"[DualPIRMotionDetector] ❌ Error monitoring {camera_name}: {e}")
+                print(f"[DualPIRMotionDetector] ❌ Error monitoring PIR sensors: {e}")
                 time.sleep(1)
     
+    def _process_sensor_state(self, camera_name: str, current_state: bool, debug_counter: int):
+        """Run edge detection and cooldown for one sensor sample"""
+        sensor_config = self.sensors[camera_name]
+        gpio_pin = sensor_config['gpio_pin']
+        
+        # Debug: Report current state every 100 edges (~10 s in simulation)
+        if debug_counter % 100 == 0:
+            state_name = "HIGH" if current_state else "LOW"
+            print(f"[DualPIRMotionDetector] 🔍 {camera_name} state: {state_name} (last_state: {sensor_config['last_state']})")
+        
+        # Edge detection: trigger on LOW to HIGH transition (motion start)
+        # TEMP: Also trigger HIGH to LOW for testing stuck sensor
+        motion_detected = False
+        
+        if current_state and not sensor_config['last_state']:
+            # Normal LOW→HIGH transition (motion detected)
+            motion_detected = True
+            motion_type = "motion_start"
+        elif not current_state and sensor_config['last_state']:
+            # HIGH→LOW transition (motion ended) - temporary for debugging
+            motion_detected = True
+            motion_type = "motion_end"
+        
+        if motion_detected:
+            current_time = time.time()
+            
+            # Check cooldown period
+            if current_time - sensor_config['last_detection'] > sensor_config['cooldown']:
+                sensor_config['last_detection'] = current_time
+                
+                timestamp = datetime.now()
+                print(f"[DualPIRMotionDetector] 🚨 {motion_type.upper()} on {camera_name} at {timestamp.strftime('%H:%M:%S')} (AM312)")
+                
+                # Create motion event
+                motion_event = {
+                    'timestamp': timestamp.isoformat(),
+                    'camera_name': camera_name,
+                    'sensor_type': 'AM312_PIR',
+                    'detection_method': 'hardware_motion_sensor',
+                    'trigger_type': 'pir_motion',
+                    'gpio_pin': gpio_pin,
+                    'motion_type': motion_type
+                }
+                
+                # Trigger callback
+                if self.motion_callback:
+                    try:
+                        self.motion_callback(camera_name, motion_event)
+                    except Exception as e:
+                        print(f"[DualPIRMotionDetector] ❌ Callback error for {camera_name}: {e}")
+        
+        # Update last state for edge detection
+        sensor_config['last_state'] = current_state
+    
     def test_sensors(self, duration: int = 30):
         """Test both PIR sensors for specified duration"""
         print(f"[DualPIRMotionDetector] 🧪 Testing both sensors for {duration} seconds...")
@@ -193,13 +230,7 @@ class DualPIRMotionDetector:
             current_time = time.time()
             
             # Check each sensor
-            for camera_name, config in self.sensors.items():
-                sensor_state = False
-                if GPIO_AVAILABLE:
-                    pir_sensor = self.pir_sensors.get(camera_name)
-                    if pir_sensor:
-                        sensor_state = pir_sensor.is_pressed
-                        
+            for camera_name, sensor_state in self._read_states().items():
                 if sensor_state:
                     elapsed = current_time - start_time
                     print(f"[DualPIRMotionDetector] ✅ {camera_name} motion detected! ({elapsed:.1f}s)")
@@ -222,15 +253,15 @@ class DualPIRMotionDetector:
             'sensors': {}
         }
         
+        states = {}
+        if GPIO_AVAILABLE:
+            try:
+                states = self._read_states()
+            except:
+                pass
+        
         for camera_name, config in self.sensors.items():
-            current_state = False
-            if GPIO_AVAILABLE:
-                try:
-                    pir_sensor = self.pir_sensors.get(camera_name)
-                    if pir_sensor:
-                        current_state = pir_sensor.is_pressed
-                except:
-                    pass
+            current_state = states.get(camera_name, False)
                     
             status['sensors'][camera_name] = {
                 'gpio_pin': config['gpio_pin'],
@@ -334,9 +334,7 @@ class PIRRecordingEngine:
                             # Frame is already in BGR format from camera manager
                             if len(frame.shape) == 3 and frame.shape[2] == 3:
                                 video_writer.write(frame)
-                                frame_count += 1
-                                if frame_count % 20 == 0:  # Log every 20 frames
-                                    logger.debug(f"📹 Recorded {frame_count} frames for {camera_name}")
+                                frame_count += 1  # Reported once when recording completes
                             else:
                                 logger.warning(f"⚠️ Invalid frame shape for {camera_name}: {frame.shape}")
                         elif frame is None:
@@ -4,6 +4,8 @@ Real-time sighting service that connects motion detection to database storage
 import sqlite3
 import time
 import threading
+import queue
+import atexit
 from datetime import datetime
 from typing import Dict, Optional
 import json
@@ -25,6 +27,22 @@ except ImportError as e:
 
 DB_PATH = '/home/p12146/Projects/Nutflix-platform/nutflix.db'
 
+# PIR callbacks only enqueue; a single writer thread flushes bursts together
+# so one commit (and one fsync) covers the whole batch instead of every row
+MOTION_BATCH_SIZE = 50
+MOTION_FLUSH_INTERVAL = 0.2  # seconds
+
+# The database fits comfortably in RAM on the Pi; memory-mapping it lets
+# dashboard reads come straight from mapped pages instead of pread per page
+DB_MMAP_SIZE = 256 * 1024 * 1024
+
+# Byte-identical SQL text on one long-lived connection hits sqlite3's
+# prepared statement cache instead of being re-parsed per batch
+MOTION_EVENT_INSERT_SQL = (
+    'INSERT INTO motion_events (timestamp, camera, motion_type, confidence, duration) '
+    'VALUES (?, ?, ?, ?, ?)'
+)
+
 class SightingService:
     def __init__(self):
         self.db_path = DB_PATH
@@ -32,6 +50,11 @@ class SightingService:
         self.running = False
         self.recent_sightings = []  # In-memory cache for quick access
         self.sighting_callbacks = []  # For real-time updates
+        self._motion_queue = queue.Queue()  # Rows waiting for the writer thread
+        self._writer_thread = None
+        self._writer_start_lock = threading.Lock()
+        self._write_conn = None  # Reused across PIR events instead of reconnecting
+        self._write_lock = threading.Lock()
         
         # PIR sensors handle all motion detection - no camera monitoring needed
         
@@ -65,13 +88,16 @@ class SightingService:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 timestamp TEXT NOT NULL,
                 camera TEXT,
-                motion_type TEXT  -- 'gpio' only (PIR sensors)
+                motion_type TEXT,  -- 'gpio' only (PIR sensors)
                 confidence REAL,
                 duration REAL,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         ''')
         
+        # Recent-event queries read newest-first; keep them off a full scan + sort
+        cur.execute('CREATE INDEX IF NOT EXISTS idx_motion_events_ts ON motion_events(timestamp DESC)')
+        
         conn.commit()
         conn.close()
         
@@ -178,27 +204,102 @@ class SightingService:
         else:
             return "Unknown Motion"
             
-    def _record_motion_event(self, timestamp: str, motion_data: Dict):
-        """Record raw motion event in database"""
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        
-        cur.execute('''
-            INSERT INTO motion_events (timestamp, camera, motion_type, confidence, duration)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
+    @staticmethod
+    def _motion_event_row(timestamp, motion_data: Dict) -> tuple:
+        """Build a motion_events row from PIR motion data"""
+        if isinstance(timestamp, int):
+            # time.time_ns() captured on the PIR path; formatted only when written
+            timestamp = datetime.fromtimestamp(timestamp / 1e9).isoformat()
+        return (
             timestamp,
             motion_data.get('camera', 'unknown'),
             motion_data.get('type', 'unknown'),
             motion_data.get('confidence', 0.0),
             motion_data.get('duration', 0.0)
-        ))
-        
-        conn.commit()
-        conn.close()
+        )
+        
+    def _get_write_connection(self) -> sqlite3.Connection:
+        """Get the long-lived motion event write connection (opened once, WAL mode)"""
+        if self._write_conn is None:
+            # Autocommit at the Python layer - transactions are opened and
+            # committed explicitly so a whole batch lands as one unit
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256,
+                                   isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=5000')
+            self._write_conn = conn
+        return self._write_conn
+        
+    def insert_motion_events(self, rows):
+        """Insert motion_events rows in a single transaction"""
+        if not rows:
+            return
+        with self._write_lock:
+            conn = self._get_write_connection()
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                conn.executemany(MOTION_EVENT_INSERT_SQL, rows)
+                conn.execute('COMMIT')
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                raise
+            
+    def _ensure_motion_writer(self):
+        """Start the single motion event writer thread on first use"""
+        if self._writer_thread is not None:
+            return
+        with self._writer_start_lock:
+            if self._writer_thread is None:
+                thread = threading.Thread(target=self._motion_writer_loop, name='motion-writer', daemon=True)
+                thread.start()
+                self._writer_thread = thread
+                # Don't drop events still sitting in the queue at interpreter exit
+                atexit.register(self.flush_motion_events)
+                
+    def _motion_writer_loop(self):
+        """Drain the motion queue, committing up to MOTION_BATCH_SIZE events per transaction"""
+        while True:
+            events = [self._motion_queue.get()]
+            deadline = time.monotonic() + MOTION_FLUSH_INTERVAL
+            while len(events) < MOTION_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    events.append(self._motion_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                rows = [self._motion_event_row(timestamp, motion_data) for timestamp, motion_data in events]
+                self.insert_motion_events(rows)
+            except Exception as e:
+                print(f"❌ Error writing motion events: {e}")
+            finally:
+                for _ in events:
+                    self._motion_queue.task_done()
+                    
+    def queue_motion_event(self, timestamp, motion_data: Dict):
+        """
+        Hand a motion event to the writer thread and return immediately.
+        
+        timestamp may be an ISO string or a time.time_ns() value; the latter
+        is only formatted by the writer thread when the batch is flushed.
+        """
+        self._ensure_motion_writer()
+        self._motion_queue.put((timestamp, motion_data))
+            
+    def flush_motion_events(self):
+        """Block until every queued motion event has been written"""
+        self._motion_queue.join()
+            
+    def _record_motion_event(self, timestamp: str, motion_data: Dict):
+        """Record raw motion event in database (written by the motion writer thread)"""
+        self.queue_motion_event(timestamp, motion_data)
         
         # NEW: Check for clip that might be associated with this motion event
-        print(f"📊 Motion event recorded: {motion_data.get('camera')} at {timestamp}")
+        print(f"📊 Motion event queued: {motion_data.get('camera')} at {timestamp}")
     
     # NEW: Method to link clips with motion events
     def link_clip_to_recent_motion(self, camera_name: str, clip_path: str, thumbnail_path: str = None):
@@ -367,6 +468,7 @@ class SightingService:
     def get_recent_sightings(self, limit: int = 10, camera: Optional[str] = None) -> list:
         """Get recent sightings from database, reading from clip_metadata table"""
         conn = sqlite3.connect(self.db_path)
+        conn.execute(f'PRAGMA mmap_size={DB_MMAP_SIZE}')
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         
@@ -428,6 +530,7 @@ class SightingService:
     def get_sighting_stats(self) -> Dict:
         """Get sighting statistics"""
         conn = sqlite3.connect(self.db_path)
+        conn.execute(f'PRAGMA mmap_size={DB_MMAP_SIZE}')
         cur = conn.cursor()
         
         # Total sightings today
@@ -14,6 +14,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from flask import Flask, redirect, url_for, render_template, jsonify, send_from_directory, request, Response, make_response, send_file
 from flask_cors import CORS
 import json
+import hashlib
 from datetime import datetime, timedelta
 
 # Import clip manager for latest clip functionality
@@ -296,13 +297,25 @@ def api_motion_status():
         except ImportError:
             status['ir_status'] = {'ir_available': False, 'message': 'IR controller not available'}
         
-        return jsonify(status)
+        # Pollers that send back the ETag get a bodyless 304 while nothing changed
+        response = jsonify(status)
+        response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/motion/trigger-test')
 def api_trigger_test_sighting():
-    """Manually trigger a test sighting for demonstration"""
+    """Manually trigger a test sighting for demonstration
+
+    ?camera=NestCam (or CritterCam) pins the sighting to that camera;
+    without it one is picked at random.
+    """
+    cameras = ['CritterCam', 'NestCam']
+    camera = request.args.get('camera')
+    if camera is not None and camera not in cameras:
+        return jsonify({'error': f"Unknown camera '{camera}', expected one of {cameras}"}), 400
+    
     try:
         import sqlite3
         from datetime import datetime
@@ -317,7 +330,7 @@ def api_trigger_test_sighting():
         species = "Human"  # Since user is testing
         behavior = "investigating"
         confidence = 0.92
-        camera = random.choice(['CritterCam', 'NestCam'])
+        camera = camera or random.choice(cameras)
         
         cur.execute('''
             INSERT INTO clip_metadata (timestamp, species, behavior, confidence, camera, motion_zone)
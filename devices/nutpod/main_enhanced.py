@@ -87,11 +87,16 @@ def main():
     print(f"   Data retention: {settings.privacy.data.retention_period} days")
     
     # Check if recording/streaming is allowed based on privacy settings
-    if not settings.is_recording_allowed():
+    # (evaluated once for the whole startup phase)
+    recording_allowed = settings.is_recording_allowed()
+    audio_recording_allowed = settings.is_audio_recording_allowed()
+    streaming_allowed = settings.is_streaming_allowed()
+    
+    if not recording_allowed:
         print("⚠️  [Privacy] Recording is disabled by privacy settings!")
         print("   To enable recording, check privacy.camera.recording_enabled")
         
-    if not settings.is_streaming_allowed():
+    if not streaming_allowed:
         print("⚠️  [Privacy] Streaming is disabled by privacy settings!")
     
     # Initialize core components with privacy-aware settings
@@ -102,7 +107,7 @@ def main():
     
     # Recording Engine - only initialize if recording is allowed
     recorder = None
-    if settings.is_recording_allowed():
+    if recording_allowed:
         recorder = RecordingEngine("nutpod", cam_mgr)
         print("✅ [Recording] Recording engine initialized")
     else:
@@ -110,7 +115,7 @@ def main():
     
     # Audio Recorder - privacy-aware initialization
     audio_recorder = None
-    if settings.is_audio_recording_allowed():
+    if audio_recording_allowed:
         try:
             audio_recorder = AudioRecorder()
             print("✅ [Audio] Audio recorder initialized")
@@ -122,7 +127,7 @@ def main():
     # Stream Server - privacy-aware initialization
     stream_server = None
     stream_thread = None
-    if settings.is_streaming_allowed():
+    if streaming_allowed:
         stream_server = StreamServer("nutpod")
         stream_port = settings.network.streaming_port
         stream_thread = threading.Thread(
@@ -169,18 +174,22 @@ def main():
         motion_flags[camera_name] = now
         logging.info(f"[Motion] Motion detected on {camera_name} at {timestamp}")
         
+        # Privacy can change at runtime, so read the flags once per event
+        recording_allowed = settings.is_recording_allowed()
+        audio_recording_allowed = settings.is_audio_recording_allowed()
+        
         # Start recording only if privacy allows and recorder is available
-        if recorder and settings.is_recording_allowed():
+        if recorder and recording_allowed:
             if not recorder.is_recording():
                 logging.info(f"[Motion] Starting recording for {camera_name}")
                 recorder.start_recording(camera_name)
             else:
                 logging.info(f"[Motion] Already recording; skipping new trigger for {camera_name}")
-        elif not settings.is_recording_allowed():
+        elif not recording_allowed:
             logging.info(f"[Motion] Recording disabled by privacy settings for {camera_name}")
         
         # Motion-triggered audio with enhanced privacy controls
-        if camera_name == "NestCam" and settings.is_audio_recording_allowed():
+        if camera_name == "NestCam" and audio_recording_allowed:
             if audio_recorder is not None:
                 # Get audio settings from new system
                 audio_config = integrator.get_audio_config()
@@ -212,7 +221,7 @@ def main():
                     logging.info(f"[Audio] Mic recording cooldown active for {camera_name}")
             else:
                 logging.warning(f"[Audio] AudioRecorder not available; skipping mic recording for {camera_name}")
-        elif camera_name == "NestCam" and not settings.is_audio_recording_allowed():
+        elif camera_name == "NestCam" and not audio_recording_allowed:
             logging.info(f"[Audio] Mic recording disabled by privacy settings for {camera_name}")
     
     # Initialize Motion Detector
@@ -13,10 +13,10 @@ def test_bme280_now():
     print("=" * 50)
     
     # First check if it's detected on I2C
-    import subprocess
-    result = subprocess.run(['i2cdetect', '-y', '1'], capture_output=True, text=True)
+    from utils.i2c_bus import i2c_addresses
+    addresses = i2c_addresses()
     
-    if '76' in result.stdout or '77' in result.stdout:
+    if 0x76 in addresses or 0x77 in addresses:
         print("✅ BME280 detected on I2C bus!")
         
         try:
@@ -137,14 +137,18 @@ def check_cameras():
         except Exception as e:
             print(f"❌ Picamera2 not working: {e}")
         
-        # Method 2: Try listing video devices
-        result = subprocess.run(['ls', '/dev/video*'], 
-                              capture_output=True, text=True, check=False)
-        if result.returncode == 0:
-            print("✅ Video devices found:")
-            print(result.stdout)
-        else:
-            print("❌ No video devices found")
+        # Method 2: List every V4L2 device, grouped by driver, in one fork
+        # (the old `ls /dev/video*` never matched: no shell to expand the glob)
+        try:
+            result = subprocess.run(['v4l2-ctl', '--list-devices'],
+                                  capture_output=True, text=True, check=False, timeout=5)
+            if result.returncode == 0 and result.stdout.strip():
+                print("✅ Video devices found:")
+                print(result.stdout)
+            else:
+                print("❌ No video devices found")
+        except FileNotFoundError:
+            print("❌ v4l2-ctl not installed - install with: sudo apt install v4l-utils")
             
         # Method 3: Check for camera modules
         result = subprocess.run(['lsmod'], capture_output=True, text=True)
@@ -6,6 +6,7 @@ This will help you get the system running quickly
 
 import sys
 import os
+import argparse
 import subprocess
 import time
 from pathlib import Path
@@ -58,8 +59,9 @@ def setup_environment():
         "flask", "numpy", "python-dotenv", "pyyaml", "aiofiles"
     ]
     
-    for package in basic_packages:
-        run_command(f"source .venv/bin/activate && pip install {package}", f"Installing {package}", check=False)
+    # One pip run resolves the whole set instead of restarting pip per package
+    packages = " ".join(basic_packages)
+    run_command(f"source .venv/bin/activate && pip install {packages}", f"Installing {packages}", check=False)
 
 def start_dashboard():
     """Start the dashboard in development mode"""
@@ -97,8 +99,28 @@ def start_nutpod():
     except KeyboardInterrupt:
         print("\n👋 NutPod stopped")
 
+def run_status_test():
+    """Run the system status test script"""
+    if Path("test_status.py").exists():
+        run_command("source .venv/bin/activate && python3 test_status.py", "Running system status test")
+    else:
+        print("❌ test_status.py not found")
+
+ACTIONS = {
+    'status': run_status_test,
+    'dashboard': start_dashboard,
+    'nutpod': start_nutpod,
+}
+
 def main():
     """Main quick start function"""
+    parser = argparse.ArgumentParser(description="Nutflix Platform quick start")
+    parser.add_argument('action', nargs='?', choices=sorted(ACTIONS),
+                        help="what to start without the menu")
+    parser.add_argument('--install', action=argparse.BooleanOptionalAction, default=True,
+                        help="set up the venv and base packages first (default: yes)")
+    args = parser.parse_args()
+    
     print("🐿️ Nutflix Platform - Quick Start")
     print("=" * 60)
     
@@ -109,7 +131,17 @@ def main():
     is_pi = check_pi_environment()
     
     # Setup
-    setup_environment()
+    if args.install:
+        setup_environment()
+    
+    if args.action:
+        ACTIONS[args.action]()
+        return
+    if not sys.stdin.isatty():
+        # Nobody to answer the menu (CI, ssh without a tty) - don't hang on input()
+        print("\nℹ️  No action given and no terminal attached; choose one of: "
+              + ", ".join(sorted(ACTIONS)))
+        return
     
     # Show options
     print("\n🎯 What would you like to do?")
@@ -123,10 +155,7 @@ def main():
             choice = input("\nEnter choice (1-4): ").strip()
             
             if choice == "1":
-                if Path("test_status.py").exists():
-                    run_command("source .venv/bin/activate && python3 test_status.py", "Running system status test")
-                else:
-                    print("❌ test_status.py not found")
+                run_status_test()
                 break
             elif choice == "2":
                 start_dashboard()
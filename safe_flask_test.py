@@ -33,21 +33,24 @@ def test_flask_safely():
     
     print("✅ Flask process is running")
     
+    # One keep-alive connection for every check instead of a new socket each
+    session = requests.Session()
     try:
         # Test basic connectivity
         print("🔍 Testing server connectivity...")
-        response = requests.get('http://localhost:8000/api/status', timeout=5)
+        response = session.get('http://localhost:8000/api/status', timeout=5)
         print(f"✅ Server responds: {response.status_code}")
         
         # Test sightings API
         print("🔍 Testing sightings API...")
-        response = requests.get('http://localhost:8000/api/sightings', timeout=5)
+        response = session.get('http://localhost:8000/api/sightings', timeout=5)
         print(f"✅ Sightings API responds: {response.status_code}")
         
     except requests.exceptions.RequestException as e:
         print(f"❌ Request failed: {e}")
     
     finally:
+        session.close()
         print("🛑 Stopping Flask server...")
         flask_process.terminate()
         flask_process.wait()
@@ -7,27 +7,30 @@ Works with the newer GPIO libraries on Pi 5
 import sys
 import time
 import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 
 # Add project root to path
 sys.path.insert(0, '/home/p12146/Projects/Nutflix-platform')
 
+from utils.lazy_import import lazy_import
+
 def test_i2c_scan():
     """Scan for I2C devices"""
     print("\n🔍 Scanning for I2C Devices")
     print("=" * 50)
     
     try:
-        import subprocess
-        result = subprocess.run(['i2cdetect', '-y', '1'], 
-                              capture_output=True, text=True, check=False)
+        from utils.i2c_bus import i2c_scan, i2c_addresses
+        result = i2c_scan()
         
         if result.returncode == 0:
             print("✅ I2C scan results:")
             print(result.stdout)
             
             # Check for common sensor addresses
-            output = result.stdout
-            if '76' in output or '77' in output:
+            addresses = i2c_addresses()
+            if 0x76 in addresses or 0x77 in addresses:
                 print("🌡️  BME280 sensor detected at address 0x76 or 0x77!")
             else:
                 print("❌ No BME280 sensor found")
@@ -76,10 +79,9 @@ def test_pir_simple():
         critter_pir.when_pressed = critter_motion
         nest_pir.when_pressed = nest_motion
         
-        # Wait for motion for 30 seconds
-        start_time = time.time()
-        while time.time() - start_time < 30:
-            time.sleep(0.1)
+        # Wait for motion for 30 seconds; the callbacks run on gpiozero's
+        # thread, so the main thread can sleep through the whole window
+        threading.Event().wait(30)
             
         print("\n✅ PIR test completed")
         
@@ -97,8 +99,10 @@ def test_bme280_simple():
     
     try:
         # First try with the venv libraries
-        import board
-        import adafruit_bme280
+        # Blinka's import chain is slow; pay for it once per process
+        board = lazy_import('board')
+        adafruit_bme280 = lazy_import('adafruit_bme280')
+        from utils.env_sensor import read_bme280_burst
         
         # Create I2C interface
         i2c = board.I2C()
@@ -108,9 +112,8 @@ def test_bme280_simple():
         print("📊 Reading sensor data...")
         
         for i in range(3):
-            temp = bme280.temperature
-            humidity = bme280.relative_humidity
-            pressure = bme280.pressure
+            # One 8-byte burst instead of three property reads
+            temp, humidity, pressure = read_bme280_burst(bme280)
             
             print(f"🌡️  Temperature: {temp:.1f}°C")
             print(f"💧 Humidity: {humidity:.1f}%")
@@ -185,7 +188,32 @@ def show_simple_wiring():
    Pin 16 [GPIO23] ● ● [     ] Pin 17  ← IR LED
     """)
 
-def main():
+TESTS = {
+    'wiring': show_simple_wiring,
+    'i2c': test_i2c_scan,
+    'bme': test_bme280_simple,
+    'pir': test_pir_simple,
+    'gpio': test_gpio_basic,
+}
+ALL_TESTS = ['i2c', 'bme', 'pir', 'gpio']
+
+def _run_test(name):
+    """Run one test by name (module-level so worker processes can pickle it)"""
+    TESTS[name]()
+
+def run_tests(names, parallel=False):
+    """Run the named tests, expanding 'all' to every sensor test"""
+    if 'all' in names:
+        names = ALL_TESTS
+    if parallel and len(names) > 1:
+        # Sensors sit on separate pins/buses, so each test gets its own process
+        with ProcessPoolExecutor(max_workers=len(names)) as executor:
+            list(executor.map(_run_test, names))
+    else:
+        for name in names:
+            _run_test(name)
+
+def interactive_menu():
     """Simple test menu"""
     print("🐿️ Nutflix Platform - Simple Pi 5 Sensor Tests")
     print("=" * 60)
@@ -214,10 +242,7 @@ def main():
             elif choice == "5":
                 test_gpio_basic()
             elif choice == "6":
-                test_i2c_scan()
-                test_bme280_simple()
-                test_pir_simple()
-                test_gpio_basic()
+                run_tests(['all'])
             elif choice == "7":
                 print("👋 Goodbye!")
                 break
@@ -228,5 +253,26 @@ def main():
             print("\n👋 Goodbye!")
             break
 
+def main():
+    """Run the tests named on the command line, or the interactive menu"""
+    parser = argparse.ArgumentParser(description="Nutflix Platform simple Pi 5 sensor tests")
+    parser.add_argument('tests', nargs='*',
+                        help="tests to run without the menu: %s, or all" % ", ".join(TESTS))
+    parser.add_argument('--parallel', action='store_true',
+                        help="run the selected tests in separate processes")
+    args = parser.parse_args()
+    
+    if not args.tests:
+        interactive_menu()
+        return
+    unknown = [name for name in args.tests if name not in TESTS and name != 'all']
+    if unknown:
+        parser.error(f"unknown test(s): {', '.join(unknown)}")
+    
+    try:
+        run_tests(args.tests, parallel=args.parallel)
+    except KeyboardInterrupt:
+        print("\n👋 Goodbye!")
+
 if __name__ == "__main__":
     main()
@@ -4,10 +4,16 @@ SPH0645 Microphone Wiring Verification and Test
 Based on the project's documentation and working configurations
 """
 
+import re
 import sys
 import time
 import subprocess
 import os
+from pathlib import Path
+
+import numpy as np
+
+I2S_CONFIG_PATTERN = re.compile(r'i2s|sph0645|googlevoicehat', re.IGNORECASE)
 
 def check_i2s_config():
     """Check I2S configuration in boot config"""
@@ -15,17 +21,18 @@ def check_i2s_config():
     print("=" * 50)
     
     try:
+        found_overlay = False
+        # Single streaming pass over the file rather than read() + split()
         with open("/boot/firmware/config.txt", "r") as f:
-            content = f.read()
-            
-        print("📄 Boot config I2S settings:")
-        lines = content.split('\n')
-        for line in lines:
-            if 'i2s' in line.lower() or 'sph0645' in line.lower() or 'googlevoicehat' in line.lower():
-                print(f"   {line}")
+            print("📄 Boot config I2S settings:")
+            for line in f:
+                if I2S_CONFIG_PATTERN.search(line):
+                    print(f"   {line.rstrip()}")
+                    if 'googlevoicehat-soundcard' in line:
+                        found_overlay = True
                 
         # Check if the correct overlay is loaded
-        if 'googlevoicehat-soundcard' in content:
+        if found_overlay:
             print("✅ Google Voice HAT soundcard overlay found")
         else:
             print("❌ Google Voice HAT soundcard overlay not found")
@@ -47,21 +54,27 @@ def check_gpio_states():
     }
     
     try:
-        import RPi.GPIO as GPIO
-        GPIO.setmode(GPIO.BCM)
+        import lgpio
+    except ImportError:
+        print("❌ lgpio not available for pin state checking")
+        return
         
+    chip = lgpio.gpiochip_open(0)
+    try:
         for pin, description in i2s_pins.items():
             try:
-                GPIO.setup(pin, GPIO.IN)
-                state = GPIO.input(pin)
+                lgpio.gpio_claim_input(chip, pin)
+                state = lgpio.gpio_read(chip, pin)
                 print(f"   GPIO {pin:2d} ({description}): {'HIGH' if state else 'LOW'}")
             except Exception as e:
                 print(f"   GPIO {pin:2d} ({description}): Error reading - {e}")
-                
-        GPIO.cleanup()
-        
-    except ImportError:
-        print("❌ RPi.GPIO not available for pin state checking")
+            finally:
+                try:
+                    lgpio.gpio_free(chip, pin)
+                except Exception:
+                    pass
+    finally:
+        lgpio.gpiochip_close(chip)
 
 def check_power_connections():
     """Check power and ground connections"""
@@ -83,6 +96,54 @@ Expected wiring for SPH0645:
 💡 The SPH0645 only outputs on ONE channel based on SEL pin
     """)
 
+def inspect_wav(path, max_bytes=4096):
+    """Return (file size, first max_bytes of audio after the WAV header).
+
+    One open serves both the size (fstat) and the payload read.
+    """
+    with open(path, 'rb') as fh:
+        size = os.fstat(fh.fileno()).st_size
+        fh.seek(44)  # Skip WAV header
+        return size, fh.read(max_bytes)
+
+def _capture_arecord(fmt, rate, channels, duration):
+    """Capture one config by forking arecord and reading the WAV back"""
+    output_file = f"/tmp/sph0645_test_{fmt}_{rate}.wav"
+    
+    cmd = [
+        "arecord", 
+        "-D", "hw:2,0",
+        "-f", fmt,
+        "-r", str(rate),
+        "-c", str(channels), 
+        "-d", str(duration),
+        output_file
+    ]
+    
+    print(f"   Running: {' '.join(cmd)}")
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=duration+2)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+        
+    _, audio_data = inspect_wav(output_file, max_bytes=-1)
+    Path(output_file).unlink(missing_ok=True)
+    return audio_data
+
+def _capture_alsaaudio(pcm, alsaaudio, fmt, rate, channels, duration):
+    """Capture one config on an already-open PCM handle"""
+    pcm.setformat(getattr(alsaaudio, f"PCM_FORMAT_{fmt}"))
+    pcm.setrate(rate)
+    pcm.setchannels(channels)
+    pcm.setperiodsize(1024)
+    
+    data = bytearray()
+    end_time = time.monotonic() + duration
+    while time.monotonic() < end_time:
+        length, chunk = pcm.read()
+        if length > 0:
+            data += chunk
+    return bytes(data)
+
 def test_manual_arecord():
     """Test manual arecord with different settings"""
     print("\n🎤 Manual ALSA Recording Tests")
@@ -95,48 +156,45 @@ def test_manual_arecord():
         ("S32_LE", 16000, 2, 2, "Lower sample rate"),
     ]
     
-    for fmt, rate, channels, duration, desc in test_configs:
-        print(f"\n🔧 Testing: {desc}")
-        print(f"   Format: {fmt}, Rate: {rate}Hz, Channels: {channels}")
-        
-        output_file = f"/tmp/sph0645_test_{fmt}_{rate}.wav"
-        
-        cmd = [
-            "arecord", 
-            "-D", "hw:2,0",
-            "-f", fmt,
-            "-r", str(rate),
-            "-c", str(channels), 
-            "-d", str(duration),
-            output_file
-        ]
-        
-        try:
-            print(f"   Running: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=duration+2)
+    # Open the PCM once and renegotiate per config, instead of forking
+    # arecord (and paying the device open) for every config
+    pcm = None
+    try:
+        import alsaaudio
+        pcm = alsaaudio.PCM(alsaaudio.PCM_CAPTURE, alsaaudio.PCM_NORMAL, device='hw:2,0')
+        print("   Using one alsaaudio capture session for all configs")
+    except ImportError:
+        print("   alsaaudio not installed - falling back to arecord per config")
+    except Exception as e:
+        print(f"   Could not open hw:2,0 with alsaaudio ({e}) - falling back to arecord")
+    
+    try:
+        for fmt, rate, channels, duration, desc in test_configs:
+            print(f"\n🔧 Testing: {desc}")
+            print(f"   Format: {fmt}, Rate: {rate}Hz, Channels: {channels}")
             
-            if result.returncode == 0:
-                # Check file size
-                size = os.path.getsize(output_file)
-                print(f"   ✅ Success! File size: {size} bytes")
+            try:
+                if pcm is not None:
+                    audio_data = _capture_alsaaudio(pcm, alsaaudio, fmt, rate, channels, duration)
+                else:
+                    audio_data = _capture_arecord(fmt, rate, channels, duration)
+                print(f"   ✅ Success! Captured {len(audio_data)} bytes")
                 
-                # Quick check for non-zero data
-                with open(output_file, 'rb') as f:
-                    f.seek(44)  # Skip WAV header
-                    sample_data = f.read(1024)  # Read first 1KB of audio
-                    
-                non_zero_bytes = sum(1 for b in sample_data if b != 0)
+                # Quick check for non-zero data in the first 1KB of audio
+                sample_data = np.frombuffer(audio_data[:1024], dtype=np.uint8)
+                non_zero_bytes = int(np.count_nonzero(sample_data))
                 if non_zero_bytes > 10:
                     print(f"   🔊 Audio data detected! ({non_zero_bytes} non-zero bytes)")
                 else:
                     print(f"   🔇 No audio signal (only {non_zero_bytes} non-zero bytes)")
-            else:
-                print(f"   ❌ Failed: {result.stderr}")
-                
-        except subprocess.TimeoutExpired:
-            print(f"   ❌ Timeout")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+                    
+            except subprocess.TimeoutExpired:
+                print(f"   ❌ Timeout")
+            except Exception as e:
+                print(f"   ❌ Failed: {e}")
+    finally:
+        if pcm is not None:
+            pcm.close()
 
 def main():
     print("🎤 SPH0645 Microphone Diagnostic Tool")
@@ -6,7 +6,11 @@ Verify power and basic connectivity
 
 import time
 import sys
-import os
+from pathlib import Path
+
+import numpy as np
+
+from sph0645_diagnostic import inspect_wav
 
 def check_power_consumption():
     """Check if microphone is drawing power"""
@@ -78,32 +82,44 @@ BCLK → Pin 40 (GPIO 21) - Bit Clock
     """)
 
 def test_basic_connectivity():
-    """Test basic I2S device detection"""
+    """Test I2S device detection and whether the mic is producing live data"""
     print("\n🔍 I2S Device Detection")
     print("=" * 40)
     
-    # Check if the device can be opened for recording
+    # Capture through the kernel I2S driver (DMA-clocked BCLK) and look at
+    # the samples themselves rather than just the file size
     import subprocess
     
     try:
-        # Try to just open the device without recording
-        cmd = ["arecord", "-D", "hw:2,0", "-f", "S32_LE", "-r", "48000", "-c", "2", "-d", "0.1", "/tmp/quick_test.wav"]
+        cmd = ["arecord", "-D", "hw:2,0", "-f", "S32_LE", "-r", "48000", "-c", "2", "-d", "1", "/tmp/quick_test.wav"]
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
         
         if result.returncode == 0:
             print("✅ I2S device opens successfully")
             
-            # Check if file was created and has reasonable size
-            if os.path.exists("/tmp/quick_test.wav"):
-                size = os.path.getsize("/tmp/quick_test.wav")
+            try:
+                size, audio_data = inspect_wav("/tmp/quick_test.wav", max_bytes=-1)
+            except FileNotFoundError:
+                print("❌ Recording file was not created")
+            else:
                 print(f"✅ Recording file created: {size} bytes")
-                if size > 1000:  # Should be at least a few KB for 0.1 seconds
-                    print("✅ File size looks reasonable")
+                Path("/tmp/quick_test.wav").unlink(missing_ok=True)
+                
+                samples = np.frombuffer(audio_data[:len(audio_data) // 4 * 4], dtype='<i4')
+                if samples.size == 0:
+                    print("⚠️  No samples captured - file is just a header")
+                    return
+                    
+                std = float(samples.std())
+                mean = float(samples.mean())
+                print(f"📊 Samples: {samples.size}, mean: {mean:.0f}, std: {std:.0f}")
+                if std == 0:
+                    if mean == 0:
+                        print("❌ All samples are zero - mic not driving DOUT (check wiring/power)")
+                    else:
+                        print("❌ Samples stuck at a constant value - check DOUT/SEL wiring")
                 else:
-                    print("⚠️  File size very small - might be just header")
-                os.remove("/tmp/quick_test.wav")
-            else:
-                print("❌ Recording file was not created")
+                    print("✅ Live signal from the microphone")
         else:
             print(f"❌ I2S device failed to open: {result.stderr}")
             
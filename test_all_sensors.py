@@ -7,10 +7,14 @@ Test each sensor individually as you wire them up
 import sys
 import time
 import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 
 # Add project root to path
 sys.path.insert(0, '/home/p12146/Projects/Nutflix-platform')
 
+from utils.lazy_import import lazy_import
+
 def test_pir_sensors():
     """Test PIR motion sensors"""
     print("\n🔍 Testing PIR Motion Sensors")
@@ -34,15 +38,20 @@ def test_pir_sensors():
         print("\n👋 Wave your hand in front of sensors...")
         print("Press Ctrl+C to stop")
         
+        # Both pins packed into one int (bit 0 = critter, bit 1 = nest) so the
+        # idle tick is a single compare; only rising edges get reported
+        previous = 0
         while True:
-            critter_state = GPIO.input(CRITTER_PIR)
-            nest_state = GPIO.input(NEST_PIR)
+            current = GPIO.input(CRITTER_PIR) | (GPIO.input(NEST_PIR) << 1)
+            rising = current & ~previous
             
-            if critter_state:
-                print("🐿️  CritterCam PIR: MOTION DETECTED!")
-            if nest_state:
-                print("🏠 NestCam PIR: MOTION DETECTED!")
-                
+            if rising:
+                if rising & 1:
+                    print("🐿️  CritterCam PIR: MOTION DETECTED!")
+                if rising & 2:
+                    print("🏠 NestCam PIR: MOTION DETECTED!")
+                    
+            previous = current
             time.sleep(0.1)
             
     except ImportError:
@@ -63,8 +72,10 @@ def test_bme280():
     print("=" * 50)
     
     try:
-        import board
-        from adafruit_bme280.basic import Adafruit_BME280_I2C
+        # Blinka's import chain is slow; pay for it once per process
+        board = lazy_import('board')
+        Adafruit_BME280_I2C = lazy_import('adafruit_bme280.basic').Adafruit_BME280_I2C
+        from utils.env_sensor import read_bme280_burst
         
         # Create I2C interface
         i2c = board.I2C()
@@ -78,10 +89,9 @@ def test_bme280():
         print("📊 Reading sensor data...")
         
         for i in range(5):
-            temp_c = bme280_sensor.temperature
+            # One 8-byte burst instead of three property reads
+            temp_c, humidity, pressure = read_bme280_burst(bme280_sensor)
             temp_f = (temp_c * 9/5) + 32  # Convert to Fahrenheit
-            humidity = bme280_sensor.relative_humidity
-            pressure = bme280_sensor.pressure
             
             print(f"🌡️  Temperature: {temp_f:.1f}°F ({temp_c:.1f}°C)")
             print(f"💧 Humidity: {humidity:.1f}%")
@@ -98,12 +108,13 @@ def test_bme280():
         # Try to scan I2C for devices
         try:
             print("   Scanning I2C bus for devices...")
-            import subprocess
-            result = subprocess.run(['i2cdetect', '-y', '1'], capture_output=True, text=True)
+            from utils.i2c_bus import i2c_scan, i2c_addresses
+            result = i2c_scan()
             if result.returncode == 0:
                 print("I2C scan results:")
                 print(result.stdout)
-                if '76' in result.stdout or '77' in result.stdout:
+                addresses = i2c_addresses()
+                if 0x76 in addresses or 0x77 in addresses:
                     print("✅ BME280 detected on I2C bus at address 0x76 or 0x77")
                 else:
                     print("❌ No BME280 found on I2C bus")
@@ -120,34 +131,44 @@ def test_ir_led():
     print("\n💡 Testing IR LED Controller")
     print("=" * 50)
     
+    chip = None
+    IR_LED_PIN = 23  # Pin 16
     try:
-        import RPi.GPIO as GPIO
-        GPIO.setmode(GPIO.BCM)
+        import lgpio
         
-        IR_LED_PIN = 23  # Pin 16
-        GPIO.setup(IR_LED_PIN, GPIO.OUT)
+        # Talk to /dev/gpiochip directly instead of the RPi.GPIO shim on Pi 5
+        chip = lgpio.gpiochip_open(0)
+        lgpio.gpio_claim_output(chip, IR_LED_PIN, 0)
         
         print("✅ IR LED setup complete")
         print("💡 Blinking IR LED (GPIO 23, Pin 16)")
         print("   Note: IR light is invisible to human eyes")
         
-        for i in range(10):
-            GPIO.output(IR_LED_PIN, GPIO.HIGH)
-            print(f"🔴 IR LED ON  ({i+1}/10)")
-            time.sleep(1)
-            GPIO.output(IR_LED_PIN, GPIO.LOW)
-            print(f"⚫ IR LED OFF ({i+1}/10)")
-            time.sleep(1)
+        # Edges are timed by lgpio rather than Python sleeps: 1s on / 1s off x10
+        print("🔴 IR LED blinking (10 cycles)...")
+        lgpio.tx_pulse(chip, IR_LED_PIN, 1_000_000, 1_000_000, 0, 10)
+        time.sleep(20)
+        print("⚫ IR LED blink done")
+        
+        # Steady illumination at 50% duty keeps the LED cooler than full-on
+        print("🔆 IR LED PWM 1 kHz @ 50% duty for 5 seconds...")
+        lgpio.tx_pwm(chip, IR_LED_PIN, 1000, 50)
+        time.sleep(5)
+        lgpio.tx_pwm(chip, IR_LED_PIN, 0, 0)
+        print("⚫ IR LED PWM stopped")
             
     except ImportError:
-        print("❌ RPi.GPIO not available")
+        print("❌ lgpio not available - install with: sudo apt install python3-lgpio")
     except Exception as e:
         print(f"❌ IR LED error: {e}")
     finally:
-        try:
-            GPIO.cleanup()
-        except:
-            pass
+        if chip is not None:
+            try:
+                lgpio.gpio_write(chip, IR_LED_PIN, 0)
+                lgpio.gpio_free(chip, IR_LED_PIN)
+                lgpio.gpiochip_close(chip)
+            except Exception:
+                pass
 
 def test_microphone():
     """Test I2S microphone"""
@@ -155,6 +176,7 @@ def test_microphone():
     print("=" * 50)
     
     try:
+        import numpy as np
         import sounddevice as sd
         
         print("📻 Available audio devices:")
@@ -177,20 +199,29 @@ def test_microphone():
         sample_rate = 48000
         duration = 3
         
-        # Record in stereo (I2S requirement) but we'll only use one channel
-        recording = sd.rec(int(duration * sample_rate), 
-                          samplerate=sample_rate, 
-                          channels=2,
-                          device=i2s_device,
-                          dtype='float32')
-        sd.wait()
+        # Running stats, updated per block so only one block is ever in memory
+        stats = {'sum_abs': 0, 'peak': 0, 'frames': 0}
         
-        # Use left channel (microphone data is usually on left for SPH0645)
-        left_channel = recording[:, 0]
+        def on_block(indata, frames, time_info, status):
+            # Use left channel (microphone data is usually on left for SPH0645)
+            left = np.abs(indata[:, 0], dtype=np.int64)
+            stats['sum_abs'] += int(left.sum())
+            stats['peak'] = max(stats['peak'], int(left.max()))
+            stats['frames'] += frames
         
-        # Calculate volume level
-        volume = abs(left_channel).mean()
-        max_volume = abs(left_channel).max()
+        # Record in stereo (I2S requirement) but we'll only use one channel
+        with sd.InputStream(samplerate=sample_rate,
+                            channels=2,
+                            device=i2s_device,
+                            dtype='int32',
+                            blocksize=1024,
+                            callback=on_block):
+            sd.sleep(int(duration * 1000))
+        
+        # Calculate volume level (normalised to full scale like float32 capture)
+        full_scale = float(2 ** 31)
+        volume = stats['sum_abs'] / max(stats['frames'], 1) / full_scale
+        max_volume = stats['peak'] / full_scale
         
         print(f"✅ Recording complete!")
         print(f"📊 Average volume: {volume:.6f}")
@@ -208,8 +239,8 @@ def test_microphone():
             print("   BCLK -> Pin 40 (GPIO 21), SEL -> Pin 6 (GND)")
             
     except ImportError:
-        print("❌ sounddevice not available")
-        print("   Install with: pip install sounddevice")
+        print("❌ sounddevice/numpy not available")
+        print("   Install with: pip install sounddevice numpy")
     except Exception as e:
         print(f"❌ Microphone error: {e}")
         print("   Try: arecord -D hw:2,0 -f S32_LE -r 48000 -c 2 -d 3 test.wav")
@@ -248,7 +279,32 @@ def show_wiring_guide():
                       SEL -> Pin 6 (GND)
     """)
 
-def main():
+TESTS = {
+    'wiring': show_wiring_guide,
+    'pir': test_pir_sensors,
+    'bme': test_bme280,
+    'ir': test_ir_led,
+    'mic': test_microphone,
+}
+ALL_TESTS = ['pir', 'bme', 'ir', 'mic']
+
+def _run_test(name):
+    """Run one test by name (module-level so worker processes can pickle it)"""
+    TESTS[name]()
+
+def run_tests(names, parallel=False):
+    """Run the named tests, expanding 'all' to every sensor test"""
+    if 'all' in names:
+        names = ALL_TESTS
+    if parallel and len(names) > 1:
+        # Sensors sit on separate pins/buses, so each test gets its own process
+        with ProcessPoolExecutor(max_workers=len(names)) as executor:
+            list(executor.map(_run_test, names))
+    else:
+        for name in names:
+            _run_test(name)
+
+def interactive_menu():
     """Main test menu"""
     print("🐿️ Nutflix Platform - Sensor Test Menu")
     print("=" * 60)
@@ -277,10 +333,7 @@ def main():
             elif choice == "5":
                 test_microphone()
             elif choice == "6":
-                test_pir_sensors()
-                test_bme280() 
-                test_ir_led()
-                test_microphone()
+                run_tests(['all'])
             elif choice == "7":
                 print("👋 Goodbye!")
                 break
@@ -291,5 +344,26 @@ def main():
             print("\n👋 Goodbye!")
             break
 
+def main():
+    """Run the tests named on the command line, or the interactive menu"""
+    parser = argparse.ArgumentParser(description="Nutflix Platform sensor tests")
+    parser.add_argument('tests', nargs='*',
+                        help="tests to run without the menu: %s, or all" % ", ".join(TESTS))
+    parser.add_argument('--parallel', action='store_true',
+                        help="run the selected tests in separate processes")
+    args = parser.parse_args()
+    
+    if not args.tests:
+        interactive_menu()
+        return
+    unknown = [name for name in args.tests if name not in TESTS and name != 'all']
+    if unknown:
+        parser.error(f"unknown test(s): {', '.join(unknown)}")
+    
+    try:
+        run_tests(args.tests, parallel=args.parallel)
+    except KeyboardInterrupt:
+        print("\n👋 Goodbye!")
+
 if __name__ == "__main__":
     main()
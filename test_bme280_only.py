@@ -5,12 +5,13 @@ print("🌡️ BME280 Environmental Sensor Test")
 print("=" * 50)
 
 # Check I2C first
-import subprocess
-result = subprocess.run(['i2cdetect', '-y', '1'], capture_output=True, text=True)
+from utils.i2c_bus import i2c_scan, i2c_addresses
+result = i2c_scan()
 print("I2C scan results:")
 print(result.stdout)
 
-if '76' in result.stdout or '77' in result.stdout:
+addresses = i2c_addresses()
+if 0x76 in addresses or 0x77 in addresses:
     print("✅ BME280 detected!")
     
     try:
@@ -7,6 +7,16 @@ Tests temperature, humidity, and pressure readings
 import time
 import logging
 from utils.env_sensor import EnvSensor
+from utils.i2c_bus import i2c_addresses
+
+def detect_bme280():
+    """Probe the bus; return the BME280 address string ('0x76'/'0x77') or None"""
+    addresses = i2c_addresses()
+    if 0x76 in addresses:
+        return '0x76'
+    if 0x77 in addresses:
+        return '0x77'
+    return None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
@@ -19,11 +29,9 @@ def test_bme280():
     try:
         # Test I2C detection first
         print("1️⃣ Checking I2C bus...")
-        import subprocess
-        result = subprocess.run(['i2cdetect', '-y', '1'], capture_output=True, text=True)
+        addr = detect_bme280()
         
-        if '76' in result.stdout or '77' in result.stdout:
-            addr = '0x76' if '76' in result.stdout else '0x77'
+        if addr:
             print(f"   ✅ BME280 detected at address {addr}")
         else:
             print("   ❌ BME280 not detected on I2C bus")
@@ -32,7 +40,12 @@ def test_bme280():
         
         # Test sensor readings
         print("\n2️⃣ Testing sensor readings...")
-        sensor = EnvSensor()
+        # Each read() is one burst of the data registers, not three property reads
+        sensor = EnvSensor(address=int(addr, 16))
+        if sensor.bme280 is None:
+            print(f"   ❌ BME280 not responding at address {addr}")
+            print("   💡 Check wiring: CSB→3.3V, SDO→GND, SCK→GPIO3, SDA→GPIO2")
+            return
         
         for i in range(5):
             data = sensor.read()
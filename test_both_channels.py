@@ -3,10 +3,52 @@
 Test both audio channels to see if SPH0645 is working on right channel
 """
 
-import subprocess
+import math
 import numpy as np
-import wave
-import os
+import sounddevice as sd
+
+# A channel counts as active above this average level, or 10x it at peak
+ACTIVE_MEAN_THRESHOLD = 1000.0  # Adjust as needed
+ACTIVE_PEAK_THRESHOLD = ACTIVE_MEAN_THRESHOLD * 10
+
+def _fused_channel_stats(channel, mean_threshold, peak_threshold):
+    """Mean |x|, peak |x|, standard deviation and active flag in one pass"""
+    total = 0.0
+    total_abs = 0.0
+    total_sq = 0.0
+    peak = 0.0
+    for v in channel:
+        x = float(v)
+        ax = abs(x)
+        total += x
+        total_abs += ax
+        total_sq += x * x
+        if ax > peak:
+            peak = ax
+    n = channel.size
+    mean = total / n
+    mean_abs = total_abs / n
+    active = mean_abs > mean_threshold or peak > peak_threshold
+    return mean_abs, peak, math.sqrt(max(total_sq / n - mean * mean, 0.0)), active
+
+# With numba the single-pass loop is compiled (and vectorised by LLVM);
+# without it, fall back to NumPy reductions rather than a Python loop
+try:
+    from numba import njit
+    channel_stats = njit(cache=True, fastmath=True)(_fused_channel_stats)
+except ImportError:
+    _abs_scratch = None
+    
+    def channel_stats(channel, mean_threshold, peak_threshold):
+        # |x| goes into one scratch buffer shared by both channels, instead
+        # of a fresh full-size array per call
+        global _abs_scratch
+        if _abs_scratch is None or _abs_scratch.shape != channel.shape or _abs_scratch.dtype != channel.dtype:
+            _abs_scratch = np.empty_like(channel)
+        abs_channel = np.abs(channel, out=_abs_scratch)
+        mean_abs, peak = abs_channel.mean(), abs_channel.max()
+        active = mean_abs > mean_threshold or peak > peak_threshold
+        return mean_abs, peak, channel.std(), active
 
 def test_both_channels():
     """Test both left and right channels of I2S microphone"""
@@ -14,50 +56,33 @@ def test_both_channels():
     print("=" * 50)
     
     # Record 3 seconds of stereo audio
-    output_file = "/tmp/test_both_channels_detailed.wav"
+    sample_rate = 48000
+    duration = 3
     
     print("🎵 Recording 3 seconds of audio...")
     print("💬 Make some noise now!")
     
-    cmd = [
-        "arecord", 
-        "-D", "hw:2,0",
-        "-f", "S32_LE",
-        "-r", "48000",
-        "-c", "2",
-        "-d", "3",
-        output_file
-    ]
-    
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            print(f"❌ Recording failed: {result.stderr}")
-            return
+        # Capture straight into a (frames, 2) int32 array - no arecord fork,
+        # no temporary WAV on disk and no readback
+        frames_np = sd.rec(duration * sample_rate,
+                           samplerate=sample_rate,
+                           channels=2,
+                           dtype='int32',
+                           device='hw:2,0',
+                           blocking=True)
             
         print("✅ Recording complete! Analyzing both channels...")
         
-        # Read the WAV file and analyze both channels
-        with wave.open(output_file, 'rb') as wav_file:
-            frames = wav_file.getnframes()
-            audio_data = wav_file.readframes(frames)
-            
-        # Convert to numpy array (32-bit signed integers)
-        audio_np = np.frombuffer(audio_data, dtype=np.int32)
-        
-        # Separate left and right channels
-        left_channel = audio_np[0::2]   # Every other sample starting from 0
-        right_channel = audio_np[1::2]  # Every other sample starting from 1
+        # One row per frame, one column per channel (left, right)
+        left_channel = frames_np[:, 0]
+        right_channel = frames_np[:, 1]
         
         # Calculate statistics for both channels
-        left_mean = abs(left_channel).mean()
-        left_max = abs(left_channel).max()
-        left_std = left_channel.std()
-        
-        right_mean = abs(right_channel).mean()
-        right_max = abs(right_channel).max()
-        right_std = right_channel.std()
+        left_mean, left_max, left_std, left_active = channel_stats(
+            left_channel, ACTIVE_MEAN_THRESHOLD, ACTIVE_PEAK_THRESHOLD)
+        right_mean, right_max, right_std, right_active = channel_stats(
+            right_channel, ACTIVE_MEAN_THRESHOLD, ACTIVE_PEAK_THRESHOLD)
         
         print("\n📊 Channel Analysis:")
         print("=" * 30)
@@ -71,12 +96,6 @@ def test_both_channels():
         print(f"  Peak:    {right_max:.1f}")
         print(f"  StdDev:  {right_std:.1f}")
         
-        # Determine which channel has audio
-        threshold = 1000  # Adjust as needed
-        
-        left_active = left_mean > threshold or left_max > threshold*10
-        right_active = right_mean > threshold or right_max > threshold*10
-        
         print(f"\n🔍 Results:")
         if left_active:
             print("🔊 LEFT channel has audio signal!")
@@ -103,9 +122,6 @@ def test_both_channels():
         
     except Exception as e:
         print(f"❌ Error: {e}")
-    finally:
-        if os.path.exists(output_file):
-            os.remove(output_file)
 
 if __name__ == "__main__":
     test_both_channels()
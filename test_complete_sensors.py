@@ -7,9 +7,7 @@ Tests PIR motion sensors, BME280 environmental sensor, and SPH0645 microphone
 import time
 import logging
 import threading
-from core.motion.dual_pir_motion_detector import DualPIRMotionDetector
-from utils.env_sensor import EnvSensor
-from core.audio.sph0645_microphone import SPH0645Microphone
+from concurrent.futures import ThreadPoolExecutor
 
 # Setup logging
 logging.basicConfig(
@@ -18,67 +16,69 @@ logging.basicConfig(
     handlers=[logging.StreamHandler()]
 )
 
-def test_all_sensors():
-    """Test all connected sensors"""
-    print("🧪 NutFlix Complete Sensor Test")
-    print("=" * 50)
-    
-    # Test 1: Environmental Sensor (BME280)
-    print("\n1️⃣ Testing BME280 Environmental Sensor...")
+def run_bme280_test(out):
+    """Test 1: Environmental Sensor (BME280)"""
+    out.append("\n1️⃣ Testing BME280 Environmental Sensor...")
     try:
+        from utils.env_sensor import EnvSensor
         env_sensor = EnvSensor()
         env_data = env_sensor.read()
         
-        print(f"   🌡️  Temperature: {env_data['temperature']}°C")
-        print(f"   💧 Humidity: {env_data['humidity']}%")
-        print(f"   🔽 Pressure: {env_data['pressure']} hPa")
+        out.append(f"   🌡️  Temperature: {env_data['temperature']}°C")
+        out.append(f"   💧 Humidity: {env_data['humidity']}%")
+        out.append(f"   🔽 Pressure: {env_data['pressure']} hPa")
         
         if env_data['temperature'] is not None:
-            print("   ✅ BME280 sensor working correctly!")
+            out.append("   ✅ BME280 sensor working correctly!")
         else:
-            print("   ❌ BME280 sensor not responding")
+            out.append("   ❌ BME280 sensor not responding")
             
     except Exception as e:
-        print(f"   ❌ BME280 test failed: {e}")
-    
-    # Test 2: PIR Motion Sensors
-    print("\n2️⃣ Testing AM312 PIR Motion Sensors...")
+        out.append(f"   ❌ BME280 test failed: {e}")
+
+def run_pir_test(out):
+    """Test 2: PIR Motion Sensors"""
+    out.append("\n2️⃣ Testing AM312 PIR Motion Sensors...")
     try:
+        from core.motion.dual_pir_motion_detector import DualPIRMotionDetector
+        
         def motion_callback(camera_name, event):
+            # Printed straight away so motion shows up while the test runs
             print(f"   🚨 Motion detected on {camera_name}!")
             print(f"      GPIO: {event['gpio_pin']}, Time: {event['timestamp']}")
         
         pir_detector = DualPIRMotionDetector(motion_callback=motion_callback)
         pir_detector.start_detection()
         
-        print("   📡 PIR sensors initialized:")
-        print("      - CritterCam: GPIO 18 (Pin 12)")
-        print("      - NestCam: GPIO 24 (Pin 18)")
-        print("   👋 Wave your hand in front of sensors for 15 seconds...")
+        out.append("   📡 PIR sensors initialized:")
+        out.append("      - CritterCam: GPIO 18 (Pin 12)")
+        out.append("      - NestCam: GPIO 24 (Pin 18)")
         
         # Test for 15 seconds
         time.sleep(15)
         
         pir_detector.stop_detection()
-        print("   ✅ PIR sensor test complete")
+        out.append("   ✅ PIR sensor test complete")
         
     except Exception as e:
-        print(f"   ❌ PIR test failed: {e}")
-    
-    # Test 3: I2S Microphone
-    print("\n3️⃣ Testing SPH0645 I2S Microphone...")
+        out.append(f"   ❌ PIR test failed: {e}")
+
+def run_microphone_test(out):
+    """Test 3: I2S Microphone"""
+    out.append("\n3️⃣ Testing SPH0645 I2S Microphone...")
     try:
         # Check if I2S microphone is available
         import subprocess
         result = subprocess.run(['arecord', '-l'], capture_output=True, text=True)
         
         if 'sndrpigooglevoi' in result.stdout:
-            print("   🎤 I2S microphone detected in ALSA")
-            print("   ✅ SPH0645 microphone ready")
+            out.append("   🎤 I2S microphone detected in ALSA")
+            out.append("   ✅ SPH0645 microphone ready")
             
             # Optional: Test recording for 3 seconds
-            print("   🔴 Testing 3-second recording...")
+            out.append("   🔴 Testing 3-second recording...")
             try:
+                from core.audio.sph0645_microphone import SPH0645Microphone
                 mic = SPH0645Microphone()
                 
                 # Record for 3 seconds
@@ -91,20 +91,38 @@ def test_all_sensors():
                 mic.stop_recording()
                 
                 if recording_data:
-                    print("   ✅ Audio recording successful!")
+                    out.append("   ✅ Audio recording successful!")
                 else:
-                    print("   ⚠️  No audio data captured")
+                    out.append("   ⚠️  No audio data captured")
                     
             except Exception as rec_e:
-                print(f"   ⚠️  Recording test failed: {rec_e}")
-                print("   💡 Microphone detected but recording needs configuration")
+                out.append(f"   ⚠️  Recording test failed: {rec_e}")
+                out.append("   💡 Microphone detected but recording needs configuration")
                 
         else:
-            print("   ❌ I2S microphone not detected")
-            print("   💡 Check I2S configuration in /boot/config.txt")
+            out.append("   ❌ I2S microphone not detected")
+            out.append("   💡 Check I2S configuration in /boot/config.txt")
             
     except Exception as e:
-        print(f"   ❌ Microphone test failed: {e}")
+        out.append(f"   ❌ Microphone test failed: {e}")
+
+def test_all_sensors():
+    """Test all connected sensors"""
+    print("🧪 NutFlix Complete Sensor Test")
+    print("=" * 50)
+    
+    # Tests 1-3 only block on I/O (I2C, GPIO edges, ALSA), so they run side
+    # by side and the BME280/mic checks overlap the 15 s PIR window. Each
+    # test buffers its report, printed in order once all have finished.
+    print("\n🔄 Running BME280, PIR and microphone tests in parallel...")
+    print("   👋 Wave your hand in front of the PIR sensors for 15 seconds...")
+    subtests = [run_bme280_test, run_pir_test, run_microphone_test]
+    reports = {subtest: [] for subtest in subtests}
+    with ThreadPoolExecutor(max_workers=len(subtests)) as executor:
+        for future in [executor.submit(subtest, reports[subtest]) for subtest in subtests]:
+            future.result()
+    for subtest in subtests:
+        print("\n".join(reports[subtest]))
     
     # Test 4: System Integration
     print("\n4️⃣ Testing System Integration...")
@@ -112,6 +130,8 @@ def test_all_sensors():
         print("   🔗 All sensors can be initialized together:")
         
         # Initialize all components
+        from utils.env_sensor import EnvSensor
+        from core.motion.dual_pir_motion_detector import DualPIRMotionDetector
         env_sensor = EnvSensor()
         pir_detector = DualPIRMotionDetector()
         
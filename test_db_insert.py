@@ -4,17 +4,26 @@ sys.path.insert(0, '.')
 import sqlite3
 from datetime import datetime
 
+# Same statement text the service's motion writer uses, so the two can't drift
+from core.sighting_service import MOTION_EVENT_INSERT_SQL, DB_MMAP_SIZE
+
 # Add a test motion event
-conn = sqlite3.connect('nutflix.db')
+# isolation_level=None: no implicit BEGIN, transactions are explicit
+conn = sqlite3.connect('nutflix.db', cached_statements=256, isolation_level=None)
+# WAL lets the dashboard keep reading while PIR events are written; NORMAL
+# sync is safe under WAL and drops the extra fsync per commit
+conn.execute('PRAGMA journal_mode=WAL')
+conn.execute('PRAGMA synchronous=NORMAL')
+conn.execute('PRAGMA busy_timeout=5000')
+# Serve the recent-events read from mapped pages rather than pread per page
+conn.execute(f'PRAGMA mmap_size={DB_MMAP_SIZE}')
 cur = conn.cursor()
+# Index-backed ORDER BY timestamp DESC LIMIT for the recent events query
+cur.execute('CREATE INDEX IF NOT EXISTS idx_motion_events_ts ON motion_events(timestamp DESC)')
 
 timestamp = datetime.now().isoformat()
-cur.execute('''
-    INSERT INTO motion_events (timestamp, camera, motion_type, confidence, duration)
-    VALUES (?, ?, ?, ?, ?)
-''', (timestamp, 'CritterCam', 'gpio', 0.95, 2.3))
-
-conn.commit()
+# A single row in autocommit mode is its own transaction
+conn.execute(MOTION_EVENT_INSERT_SQL, (timestamp, 'CritterCam', 'gpio', 0.95, 2.3))
 print(f"✅ Added test motion event: {timestamp} - CritterCam - gpio")
 
 # Show recent events
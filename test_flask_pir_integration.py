@@ -5,6 +5,7 @@ Test Flask PIR Integration - Test just the PIR startup part
 
 import sys
 import os
+import traceback
 
 # Add the parent directory to Python path so we can import 'core'
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -47,7 +48,6 @@ def main():
             print("✅ PIR integration logic works!")
         except Exception as e:
             print(f"❌ Failed to create PIR detector: {e}")
-            import traceback
             print(f"🔥 TRACEBACK: {traceback.format_exc()}")
     else:
         print(f"❌ PIR motion detection would NOT start:")
@@ -45,22 +45,18 @@ def test_gpio_24_hardware():
             state_24 = lgpio.gpio_read(chip, PIR_PIN_24)
             print(f"✅ GPIO {PIR_PIN_24}: Available, state = {state_24}")
             
-            # Try different pull resistor settings
-            lgpio.gpio_free(chip, PIR_PIN_24)
-            
             print(f"\n🔧 Testing different pull resistor configurations on GPIO {PIR_PIN_24}:")
             
-            # Test with pull-up
+            # Re-claiming a line this handle already owns just reconfigures its
+            # flags, so the pin is never released between probes
             lgpio.gpio_claim_input(chip, PIR_PIN_24, lgpio.SET_PULL_UP)
             state_up = lgpio.gpio_read(chip, PIR_PIN_24)
             print(f"   Pull-UP:   {state_up}")
-            lgpio.gpio_free(chip, PIR_PIN_24)
             
             # Test with no pull resistor
             lgpio.gpio_claim_input(chip, PIR_PIN_24, lgpio.SET_PULL_NONE)
             state_none = lgpio.gpio_read(chip, PIR_PIN_24)
             print(f"   Pull-NONE: {state_none}")
-            lgpio.gpio_free(chip, PIR_PIN_24)
             
             # Test with pull-down (original)
             lgpio.gpio_claim_input(chip, PIR_PIN_24, lgpio.SET_PULL_DOWN)
@@ -82,10 +78,19 @@ def test_gpio_24_hardware():
         print(f"\n🔄 Manual toggle test on GPIO {PIR_PIN_24}:")
         print("   Manually connecting/disconnecting GPIO 24 to 3.3V should show state changes")
         
-        for i in range(10):
-            current_state = lgpio.gpio_read(chip, PIR_PIN_24)
-            print(f"   Read {i+1}: {current_state}")
-            time.sleep(0.5)
+        # Edge alerts catch every toggle, however brief, during the window
+        edge_count = 0
+        
+        def print_edge(chip_handle, gpio, level, tick):
+            nonlocal edge_count
+            edge_count += 1
+            print(f"   Edge {edge_count}: GPIO {gpio} -> {level}")
+        
+        lgpio.gpio_claim_alert(chip, PIR_PIN_24, lgpio.BOTH_EDGES, lgpio.SET_PULL_DOWN)
+        edge_callback = lgpio.callback(chip, PIR_PIN_24, lgpio.BOTH_EDGES, print_edge)
+        time.sleep(5)
+        edge_callback.cancel()
+        print(f"   {edge_count} edges seen in 5 seconds")
             
     except Exception as e:
         print(f"❌ Error during hardware test: {e}")
@@ -4,6 +4,7 @@ Simple GPIO 24 PIR Sensor Test
 Tests only the NestCam PIR sensor on GPIO 24
 """
 
+import asyncio
 import time
 import sys
 try:
@@ -13,6 +14,38 @@ except ImportError:
     print("❌ lgpio library not available")
     sys.exit(1)
 
+async def watch_edges(chip, pin, state, duration=10, status_interval=2):
+    """Handle PIR edges on the asyncio loop, printing status every status_interval seconds"""
+    loop = asyncio.get_running_loop()
+    
+    def handle_edge(gpio, level):
+        if level == state['level']:
+            return
+        state['changes'] += 1
+        timestamp = time.strftime("%H:%M:%S", time.localtime())
+        print(f"[{timestamp}] 🔄 GPIO {gpio} changed: {state['level']} → {level}")
+        
+        if level == 1:
+            print(f"    🚨 MOTION DETECTED on GPIO {gpio}!")
+        elif level == 0:
+            print(f"    ✅ Motion ended on GPIO {gpio}")
+            
+        state['level'] = level
+    
+    # lgpio's alert thread only forwards the edge; all handling runs on the loop
+    edge_callback = lgpio.callback(
+        chip, pin, lgpio.BOTH_EDGES,
+        lambda chip_handle, gpio, level, tick: loop.call_soon_threadsafe(handle_edge, gpio, level)
+    )
+    
+    try:
+        for _ in range(duration // status_interval):
+            timestamp = time.strftime("%H:%M:%S", time.localtime())
+            print(f"[{timestamp}] GPIO {pin}: {state['level']} (changes: {state['changes']})")
+            await asyncio.sleep(status_interval)
+    finally:
+        edge_callback.cancel()
+
 def test_gpio_24_sensor():
     """Test only GPIO 24 PIR sensor"""
     
@@ -26,12 +59,13 @@ def test_gpio_24_sensor():
         chip = lgpio.gpiochip_open(0)
         print(f"✅ GPIO chip opened successfully")
         
-        # Set PIR pin as input with pull-down resistor
-        lgpio.gpio_claim_input(chip, PIR_PIN, lgpio.SET_PULL_DOWN)
-        print(f"✅ GPIO {PIR_PIN} claimed as input with pull-down")
+        # Edge alerts on both transitions - the lgpio alert thread reports
+        # every change, so nothing is polled and short pulses aren't missed
+        lgpio.gpio_claim_alert(chip, PIR_PIN, lgpio.BOTH_EDGES, lgpio.SET_PULL_DOWN)
+        print(f"✅ GPIO {PIR_PIN} claimed for edge alerts with pull-down")
         
         print(f"\n📍 Testing GPIO {PIR_PIN} (NestCam PIR)")
-        print("🔍 Reading GPIO state (Ctrl+C to stop):")
+        print("🔍 Watching GPIO edges (Ctrl+C to stop):")
         print("Expected: LOW (0) = no motion, HIGH (1) = motion detected")
         print("-" * 60)
         
@@ -43,31 +77,12 @@ def test_gpio_24_sensor():
             print(f"❌ Error reading GPIO {PIR_PIN} - check wiring!")
             return
         
-        # Continuous reading
-        last_state = initial_state
-        state_changes = 0
+        state = {'level': initial_state, 'changes': 0}
         
-        for i in range(100):  # Run for 10 seconds (100 * 0.1s)
-            current_state = lgpio.gpio_read(chip, PIR_PIN)
-            
-            if current_state != last_state:
-                state_changes += 1
-                timestamp = time.strftime("%H:%M:%S", time.localtime())
-                print(f"[{timestamp}] 🔄 GPIO {PIR_PIN} changed: {last_state} → {current_state}")
-                
-                if current_state == 1:
-                    print(f"    🚨 MOTION DETECTED on GPIO {PIR_PIN}!")
-                elif current_state == 0:
-                    print(f"    ✅ Motion ended on GPIO {PIR_PIN}")
-                    
-                last_state = current_state
-            
-            # Print status every 2 seconds
-            if i % 20 == 0:
-                timestamp = time.strftime("%H:%M:%S", time.localtime())
-                print(f"[{timestamp}] GPIO {PIR_PIN}: {current_state} (changes: {state_changes})")
-            
-            time.sleep(0.1)
+        asyncio.run(watch_edges(chip, PIR_PIN, state))
+        
+        state_changes = state['changes']
+        current_state = state['level']
         
         print(f"\n📊 Test completed:")
         print(f"   Total state changes: {state_changes}")
@@ -5,11 +5,16 @@ PIR Motion Simulation Test - Test the full callback chain
 
 import sys
 import os
+import traceback
+import time
+import logging
 from datetime import datetime
 
 # Add the parent directory to Python path so we can import 'core'
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+logger = logging.getLogger(__name__)
+
 def main():
     print("🔥 Testing PIR Motion Callback Chain...")
     
@@ -21,14 +26,30 @@ def main():
         print(f"❌ Sighting service import failed: {e}")
         return
     
+    # AM312 modules fire several rising edges per physical motion, so events
+    # inside the configured cooldown are dropped before they reach the DB
+    try:
+        from core.settings.integration import get_settings_integrator
+        cooldown_period = get_settings_integrator("nutpod").get_motion_config()['cooldown_period']
+    except Exception as e:
+        print(f"⚠️ Motion settings unavailable, using default cooldown: {e}")
+        cooldown_period = 10
+    last_trigger = {}
+    
     # Create the same callback as in Flask
     def pir_motion_callback(camera_name: str, motion_event: dict):
         """Handle PIR motion detection events - same as Flask"""
-        print(f"🔥 CALLBACK TRIGGERED! camera_name={camera_name}")
-        print(f"🔥 CALLBACK motion_event={motion_event}")
+        now = time.monotonic()
+        if now - last_trigger.get(camera_name, float('-inf')) < cooldown_period:
+            logger.debug("⏳ Ignoring %s edge inside %ss cooldown", camera_name, cooldown_period)
+            return
+        last_trigger[camera_name] = now
+        
+        logger.debug("🔥 CALLBACK TRIGGERED! camera_name=%s", camera_name)
+        logger.debug("🔥 CALLBACK motion_event=%s", motion_event)
         
         try:
-            print(f"🚨 PIR Motion detected: {camera_name} - {motion_event}")
+            logger.debug("🚨 PIR Motion detected: %s - %s", camera_name, motion_event)
             
             # Create motion data compatible with sighting service
             motion_data = {
@@ -41,15 +62,14 @@ def main():
                 'trigger_type': motion_event.get('trigger_type', 'pir_motion')
             }
             
-            print(f"🔥 CALLING _record_motion_event with motion_data={motion_data}")
-            # Record the motion event
+            logger.debug("🔥 CALLING queue_motion_event with motion_data=%s", motion_data)
+            # Queue the motion event - bursts are written in one transaction
             timestamp = motion_event.get('timestamp')
-            sighting_service._record_motion_event(timestamp, motion_data)
-            print(f"✅ Motion event recorded to database: {camera_name}")
+            sighting_service.queue_motion_event(timestamp, motion_data)
+            logger.info("✅ Motion event queued for database: %s", camera_name)
             
         except Exception as e:
             print(f"❌ Error handling PIR motion: {e}")
-            import traceback
             print(f"🔥 FULL TRACEBACK: {traceback.format_exc()}")
     
     # Simulate a PIR motion event
@@ -66,6 +86,7 @@ def main():
     
     # Call the callback with test data
     pir_motion_callback('CritterCam', test_motion_event)
+    sighting_service.flush_motion_events()
     
     print("\n🔍 Checking if motion appeared in database...")
     try:
@@ -80,4 +101,5 @@ def main():
         print(f"❌ Error checking sightings: {e}")
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     main()
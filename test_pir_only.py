@@ -7,14 +7,18 @@ print("This will watch for motion for 10 seconds")
 print("Wave your hand in front of the sensors!")
 print()
 
-import time
+import threading
+
+PIR_PINS = {18: "CritterCam", 12: "NestCam"}
+MOTION_TARGET = 5  # End the test early once this many events are seen
 
 try:
-    from gpiozero import Button
+    import lgpio
     
-    # Setup PIR sensors
-    critter_pir = Button(18, pull_up=False)  # Pin 12
-    nest_pir = Button(12, pull_up=False)     # Pin 32
+    # One chip handle for both sensors; lgpio's alert thread delivers edges
+    chip = lgpio.gpiochip_open(0)
+    for pin in PIR_PINS:
+        lgpio.gpio_claim_alert(chip, pin, lgpio.RISING_EDGE, lgpio.SET_PULL_DOWN)
     
     print("✅ PIR sensors ready:")
     print("📍 CritterCam PIR: GPIO 18 (Pin 12)")  
@@ -22,19 +26,24 @@ try:
     print()
     
     motion_count = 0
+    done = threading.Event()
     
-    def motion_detected(sensor_name):
+    def motion_detected(chip_handle, gpio, level, tick):
         global motion_count
         motion_count += 1
-        print(f"🚨 {sensor_name}: MOTION #{motion_count}!")
+        print(f"🚨 {PIR_PINS[gpio]}: MOTION #{motion_count}!")
+        if motion_count >= MOTION_TARGET:
+            done.set()
     
-    critter_pir.when_pressed = lambda: motion_detected("CritterCam")
-    nest_pir.when_pressed = lambda: motion_detected("NestCam")
+    callbacks = [lgpio.callback(chip, pin, lgpio.RISING_EDGE, motion_detected) for pin in PIR_PINS]
     
     print("👋 Wave your hand around the sensors...")
-    for i in range(10, 0, -1):
-        print(f"⏰ {i} seconds left...", end='\r')
-        time.sleep(1)
+    print(f"⏰ Watching for up to 10 seconds (or {MOTION_TARGET} motion events)...")
+    done.wait(timeout=10)
+    
+    for cb in callbacks:
+        cb.cancel()
+    lgpio.gpiochip_close(chip)
     
     print(f"\n🎯 Test complete! Detected {motion_count} motion events")
     
@@ -2,10 +2,10 @@
 import sys
 sys.path.insert(0, '.')
 from core.sighting_service import sighting_service
-from datetime import datetime
+import time
 
 # Manually trigger a PIR motion event
-timestamp = datetime.now().isoformat()
+timestamp = time.time_ns()  # formatted by the writer thread at flush time
 motion_data = {
     'camera': 'NestCam',
     'type': 'gpio', 
@@ -14,6 +14,7 @@ motion_data = {
 }
 
 print('📡 Recording test PIR motion event...')
-sighting_service._record_motion_event(timestamp, motion_data)
+sighting_service.queue_motion_event(timestamp, motion_data)
+sighting_service.flush_motion_events()
 print('✅ PIR motion event recorded to database')
 print('🔍 Check dashboard for new motion event')
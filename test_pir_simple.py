@@ -8,7 +8,7 @@ import sys
 import os
 sys.path.append('/home/p12146/NutFlix/nutflix-platform')
 
-import time
+import asyncio
 import logging
 from core.motion.dual_pir_motion_detector import DualPIRMotionDetector
 
@@ -42,16 +42,29 @@ def main():
     print("🛑 Press Ctrl+C to stop")
     print("=" * 50)
     
+    try:
+        asyncio.run(main_async())
+    except KeyboardInterrupt:
+        pass
+
+async def main_async():
+    """Handle PIR events on the event loop - idle until the detector queues one"""
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+    
+    def enqueue_motion(camera_name, motion_event):
+        # Called on the detector thread; hand the event to the loop
+        loop.call_soon_threadsafe(events.put_nowait, (camera_name, motion_event))
+    
     # Initialize PIR detector
-    pir_detector = DualPIRMotionDetector(motion_callback=motion_callback)
+    pir_detector = DualPIRMotionDetector(motion_callback=enqueue_motion)
     pir_detector.start_detection()
     
     try:
-        # Run indefinitely
         while True:
-            time.sleep(1)
-            
-    except KeyboardInterrupt:
+            camera_name, motion_event = await events.get()
+            motion_callback(camera_name, motion_event)
+    finally:
         print("\n🛑 Stopping PIR detection...")
         pir_detector.stop_detection()
         print("✅ PIR detection stopped")
@@ -4,6 +4,9 @@ PIR Sensor Wiring Test Script
 Tests GPIO connections for CritterCam (GPIO 18) and NestCam (GPIO 24) PIR sensors
 """
 
+import collections
+import os
+import select
 import time
 import sys
 try:
@@ -28,54 +31,91 @@ def test_pir_wiring():
         chip = lgpio.gpiochip_open(0)
         print(f"✅ GPIO chip opened successfully")
         
-        # Set PIR pins as inputs with pull-down resistors
-        lgpio.gpio_claim_input(chip, CRITTERCAM_PIR_PIN, lgpio.SET_PULL_DOWN)
-        lgpio.gpio_claim_input(chip, NESTCAM_PIR_PIN, lgpio.SET_PULL_DOWN)
-        print(f"✅ GPIO pins claimed as inputs with pull-down")
+        # Edge alerts on both pins - lgpio's alert thread queues every
+        # transition, so nothing is sampled and short pulses aren't missed
+        lgpio.gpio_claim_alert(chip, CRITTERCAM_PIR_PIN, lgpio.BOTH_EDGES, lgpio.SET_PULL_DOWN)
+        lgpio.gpio_claim_alert(chip, NESTCAM_PIR_PIN, lgpio.BOTH_EDGES, lgpio.SET_PULL_DOWN)
+        print(f"✅ GPIO pins claimed for edge alerts with pull-down")
         
         print(f"\n📍 Testing GPIO {CRITTERCAM_PIR_PIN} (CritterCam PIR)")
         print(f"📍 Testing GPIO {NESTCAM_PIR_PIN} (NestCam PIR)")
-        print("\n🔍 Reading GPIO states (Ctrl+C to stop):")
+        print("\n🔍 Watching GPIO edges (Ctrl+C to stop):")
         print("Expected: LOW (0) = no motion, HIGH (1) = motion detected")
         print("-" * 60)
         
-        # Continuous reading
+        critter_state = lgpio.gpio_read(chip, CRITTERCAM_PIR_PIN)
+        nest_state = lgpio.gpio_read(chip, NESTCAM_PIR_PIN)
+        
+        # The eventfd counter just accumulates while we're busy, so a burst
+        # of edges costs one select() wakeup and one read, not one per edge.
+        # Unbounded so no edge is lost if the loop falls behind.
+        edges = collections.deque()
+        efd = os.eventfd(0, os.EFD_NONBLOCK)
+        
+        def on_edge(chip_handle, gpio, level, tick):
+            edges.append((tick, gpio, level))
+            os.eventfd_write(efd, 1)
+        
+        callbacks = [
+            lgpio.callback(chip, CRITTERCAM_PIR_PIN, lgpio.BOTH_EDGES, on_edge),
+            lgpio.callback(chip, NESTCAM_PIR_PIN, lgpio.BOTH_EDGES, on_edge),
+        ]
+        
+        # tally() only counts with lgpio's default callback, so count here
+        edge_counts = collections.Counter()
+        
+        # Continuous monitoring
         start_time = time.time()
-        sample_count = 0
+        last_status = start_time
         
         while True:
-            # Read GPIO states
-            critter_state = lgpio.gpio_read(chip, CRITTERCAM_PIR_PIN)
-            nest_state = lgpio.gpio_read(chip, NESTCAM_PIR_PIN)
+            # Edges wake us early; the status line still comes once a second
+            select.select([efd], [], [], max(0.0, last_status + 1.0 - time.time()))
+            try:
+                os.eventfd_read(efd)
+            except BlockingIOError:
+                pass
             
-            current_time = time.time()
-            elapsed = current_time - start_time
-            sample_count += 1
+            # Drain the edges that arrived since the last wakeup
+            while edges:
+                tick, gpio, level = edges.popleft()
+                edge_counts[gpio] += 1
+                if gpio == CRITTERCAM_PIR_PIN:
+                    critter_state = level
+                    name = "CritterCam"
+                else:
+                    nest_state = level
+                    name = "NestCam"
+                print(f"    ⚡ {name} (GPIO {gpio}) → {level} at {tick / 1e9:.6f}s")
+            
+            now = time.time()
+            if now - last_status < 1.0:
+                continue
+            last_status = now
             
-            # Print state every second
-            if sample_count % 10 == 0:  # Print every 10th sample (roughly 1 second)
-                timestamp = time.strftime("%H:%M:%S", time.localtime())
-                print(f"[{timestamp}] CritterCam (GPIO {CRITTERCAM_PIR_PIN}): {critter_state} | "
-                      f"NestCam (GPIO {NESTCAM_PIR_PIN}): {nest_state}")
-                
-                # Wiring diagnostics
-                if critter_state == nest_state:
-                    if critter_state == 0:
-                        status = "✅ Both sensors LOW (normal idle state)"
-                    else:
-                        status = "⚠️ Both sensors HIGH (check for interference or wiring issue)"
+            timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+            print(f"[{timestamp}] CritterCam (GPIO {CRITTERCAM_PIR_PIN}): {critter_state} | "
+                  f"NestCam (GPIO {NESTCAM_PIR_PIN}): {nest_state}")
+            
+            # Wiring diagnostics
+            if critter_state == nest_state:
+                if critter_state == 0:
+                    status = "✅ Both sensors LOW (normal idle state)"
                 else:
-                    status = f"🔍 Different states - CritterCam: {critter_state}, NestCam: {nest_state}"
-                
-                print(f"    Status: {status}")
-                print("-" * 60)
+                    status = "⚠️ Both sensors HIGH (check for interference or wiring issue)"
+            else:
+                status = f"🔍 Different states - CritterCam: {critter_state}, NestCam: {nest_state}"
             
-            time.sleep(0.1)  # 100ms sampling rate
+            print(f"    Status: {status}")
+            print("-" * 60)
             
     except KeyboardInterrupt:
+        for cb in callbacks:
+            cb.cancel()
+        
         print(f"\n\n📊 Test Summary:")
-        print(f"⏱️ Test duration: {elapsed:.1f} seconds")
-        print(f"📈 Samples collected: {sample_count}")
+        print(f"⏱️ Test duration: {time.time() - start_time:.1f} seconds")
+        print(f"📈 Edges detected: CritterCam {edge_counts[CRITTERCAM_PIR_PIN]}, NestCam {edge_counts[NESTCAM_PIR_PIN]}")
         print(f"\n🔌 Wiring Check:")
         print(f"   • CritterCam (GPIO 18): {'✅ Connected' if critter_state is not None else '❌ Not responding'}")
         print(f"   • NestCam (GPIO 24): {'✅ Connected' if nest_state is not None else '❌ Not responding'}")
@@ -104,6 +144,7 @@ def test_pir_wiring():
             lgpio.gpio_free(chip, CRITTERCAM_PIR_PIN)
             lgpio.gpio_free(chip, NESTCAM_PIR_PIN)
             lgpio.gpiochip_close(chip)
+            os.close(efd)
             print(f"\n🧹 GPIO cleanup completed")
         except:
             pass
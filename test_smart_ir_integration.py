@@ -14,6 +14,15 @@ from core.infrared.smart_ir_controller import smart_ir_controller
 from core.sighting_service import sighting_service
 import numpy as np
 
+# Synthetic frames shared by every test. They're read-only so a controller
+# that writes into the frame it was handed fails loudly instead of skewing
+# the next test. They stay real arrays rather than broadcast views because
+# cv2.cvtColor wants concrete pixel buffers.
+BRIGHT_FRAME = np.full((480, 640, 3), 150, dtype=np.uint8)  # daylight
+DARK_FRAME = np.full((480, 640, 3), 30, dtype=np.uint8)  # nighttime
+BRIGHT_FRAME.flags.writeable = False
+DARK_FRAME.flags.writeable = False
+
 def test_smart_ir_integration():
     """Test the smart IR LED integration with motion detection"""
     
@@ -30,10 +39,7 @@ def test_smart_ir_integration():
     # Test 1: CritterCam motion (should NOT activate IR)
     print(f"\n🎥 Test 1: CritterCam Motion (should NOT activate IR)")
     
-    # Create a synthetic bright frame (daylight conditions)
-    bright_frame = np.ones((480, 640, 3), dtype=np.uint8) * 150  # Bright frame
-    
-    smart_ir_controller.on_motion_detected('CritterCam', bright_frame)
+    smart_ir_controller.on_motion_detected('CritterCam', BRIGHT_FRAME)
     time.sleep(1)
     
     status = smart_ir_controller.get_status()
@@ -43,7 +49,7 @@ def test_smart_ir_integration():
     # Test 2: NestCam motion in daylight (should NOT activate IR)
     print(f"\n🌞 Test 2: NestCam Motion in Daylight (should NOT activate IR)")
     
-    smart_ir_controller.on_motion_detected('NestCam', bright_frame)
+    smart_ir_controller.on_motion_detected('NestCam', BRIGHT_FRAME)
     time.sleep(1)
     
     status = smart_ir_controller.get_status()
@@ -53,10 +59,7 @@ def test_smart_ir_integration():
     # Test 3: NestCam motion in dark conditions (should activate IR)
     print(f"\n🌙 Test 3: NestCam Motion in Dark Conditions (should activate IR)")
     
-    # Create a synthetic dark frame (nighttime conditions)
-    dark_frame = np.ones((480, 640, 3), dtype=np.uint8) * 30  # Very dark frame
-    
-    smart_ir_controller.on_motion_detected('NestCam', dark_frame)
+    smart_ir_controller.on_motion_detected('NestCam', DARK_FRAME)
     time.sleep(1)
     
     status = smart_ir_controller.get_status()
@@ -6,12 +6,17 @@ Test SPH0645 microphone using the core audio implementation
 import sys
 import time
 import os
+import threading
+
+import numpy as np
 
 # Add project root to path
 sys.path.insert(0, '/home/p12146/Projects/Nutflix-platform')
 
 from core.audio.sph0645_microphone import SPH0645Microphone
 
+LEVEL_THRESHOLD = 50  # Mean absolute sample value; adjust as needed
+
 def test_sph0645_direct():
     """Test SPH0645 using the project's dedicated implementation"""
     print("🎤 Testing SPH0645 using core audio implementation")
@@ -24,11 +29,24 @@ def test_sph0645_direct():
         # Override the card number to match our detected device (card 2)
         mic.card = 2
         
-        # Add a callback to monitor audio levels
+        # Add a callback to monitor audio levels. It runs on the recording
+        # thread, so it only computes the level in integers (abs widened to
+        # int32 so -32768 can't wrap, int64 sum) and wakes the main loop,
+        # which does the printing as each chunk lands
+        shared = {'level': 0}
+        chunk_ready = threading.Event()
+        
         def audio_callback(audio_data, sample_rate):
-            level = abs(audio_data).mean()
-            if level > 50:  # Adjust threshold as needed
-                print(f"🔊 Audio detected! Level: {level:.1f}")
+            # The core hands us an int16 ndarray, so asarray is a no-op view;
+            # raw PCM bytes get wrapped without a copy rather than iterated
+            if isinstance(audio_data, (bytes, bytearray, memoryview)):
+                samples = np.frombuffer(audio_data, dtype=np.int16)
+            else:
+                samples = np.asarray(audio_data, dtype=np.int16)
+            if not samples.size:
+                return
+            shared['level'] = int(np.abs(samples, dtype=np.int32).sum(dtype=np.int64)) // samples.size
+            chunk_ready.set()
         
         mic.add_callback(audio_callback)
         
@@ -39,11 +57,16 @@ def test_sph0645_direct():
         
         mic.start_recording()
         
-        # Test for 10 seconds
-        for i in range(10):
-            time.sleep(1)
-            level = mic.get_audio_level()
-            print(f"[{i+1:2d}/10] Audio level: {level:.3f}")
+        # Test for 10 seconds, reporting each chunk as the callback delivers it
+        start = time.monotonic()
+        deadline = start + 10
+        while time.monotonic() < deadline:
+            if not chunk_ready.wait(timeout=0.25):
+                continue
+            chunk_ready.clear()
+            level = shared['level']
+            marker = "🔊" if level > LEVEL_THRESHOLD else "  "
+            print(f"{marker} [{time.monotonic() - start:5.2f}s] Audio level: {level}")
             
         print("✅ SPH0645 test complete!")
         
@@ -3,8 +3,16 @@
 
 import sys
 import os
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module, util
 sys.path.insert(0, '.')
 
+parser = argparse.ArgumentParser(description="Quick Nutflix Platform status check")
+parser.add_argument('--no-dashboard', action='store_true',
+                    help="skip importing the Flask dashboard app")
+args = parser.parse_args()
+
 print("🐿️ Nutflix Platform - Quick Status Check")
 print("=" * 50)
 
@@ -30,22 +38,35 @@ modules = [
     ('audio.audio_recorder', 'AudioRecorder')
 ]
 
-for module_path, class_name in modules:
+def probe_module(module_path, class_name):
+    """Import core.<module_path> (if it exists) and report on class_name"""
     try:
-        module = __import__(f'core.{module_path}', fromlist=[class_name])
-        cls = getattr(module, class_name)
-        print(f"✅ {class_name} available")
+        # find_spec is a filesystem lookup; skip the import for absent modules
+        if util.find_spec(f'core.{module_path}') is None:
+            return f"❌ {class_name}: Import error - No module named 'core.{module_path}'"
+        module = import_module(f'core.{module_path}')
+        getattr(module, class_name)
+        return f"✅ {class_name} available"
     except ImportError as e:
-        print(f"❌ {class_name}: Import error - {e}")
+        return f"❌ {class_name}: Import error - {e}"
     except Exception as e:
-        print(f"⚠️  {class_name}: {e}")
+        return f"⚠️  {class_name}: {e}"
 
-print("\n🌐 Testing dashboard...")
-try:
-    from dashboard.app import app
-    print("✅ Dashboard app created")
-    print(f"📡 Routes available: {len(list(app.url_map.iter_rules()))}")
-except Exception as e:
-    print(f"❌ Dashboard error: {e}")
+# The heavy dependencies (cv2, picamera2, numpy...) load in parallel; results
+# still print in the order listed above
+with ThreadPoolExecutor(max_workers=len(modules)) as executor:
+    for line in executor.map(lambda m: probe_module(*m), modules):
+        print(line)
+
+if args.no_dashboard:
+    print("\n🌐 Dashboard check skipped (--no-dashboard)")
+else:
+    print("\n🌐 Testing dashboard...")
+    try:
+        from dashboard.app import app
+        print("✅ Dashboard app created")
+        print(f"📡 Routes available: {sum(1 for _ in app.url_map.iter_rules())}")
+    except Exception as e:
+        print(f"❌ Dashboard error: {e}")
 
 print("\n🎯 Status check complete!")
@@ -1,7 +1,9 @@
 # utils/env_sensor.py
 
 
+import time
 import logging
+import threading
 try:
     import board
     import busio
@@ -10,15 +12,134 @@ try:
 except ImportError:
     HW_AVAILABLE = False
 
+# Optional JIT for the compensation formulas (pip install numba)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from utils.i2c_bus import SMBUS_AVAILABLE, burst_read
+
+# press_msb..press_xlsb, temp_msb..temp_xlsb, hum_msb, hum_lsb
+BME280_DATA_REGISTER = 0xF7
+BME280_DATA_LENGTH = 8
+
+# Readings newer than this are served from memory instead of the I2C bus
+READ_CACHE_TTL = 0.5
+
+# Cadence of the optional background reader (EnvSensor.start)
+READER_PERIOD = 1.0
+# A published reading older than this many periods means the reader has
+# stopped getting data off the bus; it is reported as unavailable
+READER_STALE_PERIODS = 3
+
+NO_READING = {"temperature": None, "humidity": None, "pressure": None}
+
+
+def bme280_calibration(bme280):
+    """Snapshot the driver's trimming coefficients as (temp, pressure, humidity) tuples.
+
+    They're fixed in the sensor's NVM, so callers that read repeatedly can
+    take this once and hand it to read_bme280_burst.
+    """
+    # All floats, so the compiled _compensate sees one stable signature
+    return (tuple(float(c) for c in bme280._temp_calib),
+            tuple(float(c) for c in bme280._pressure_calib),
+            tuple(float(c) for c in bme280._humidity_calib))
+
+
+def _compensate(adc_t, adc_p, adc_h, t_cal, p_cal, h_cal):
+    """Bosch datasheet float compensation of the raw ADC words"""
+    # Temperature (also yields t_fine for the other two channels)
+    var1 = (adc_t / 16384.0 - t_cal[0] / 1024.0) * t_cal[1]
+    var2 = (adc_t / 131072.0 - t_cal[0] / 8192.0) ** 2 * t_cal[2]
+    t_fine = int(var1 + var2)
+    temperature = t_fine / 5120.0
+
+    # Pressure
+    var1 = t_fine / 2.0 - 64000.0
+    var2 = var1 * var1 * p_cal[5] / 32768.0
+    var2 = var2 + var1 * p_cal[4] * 2.0
+    var2 = var2 / 4.0 + p_cal[3] * 65536.0
+    var3 = p_cal[2] * var1 * var1 / 524288.0
+    var1 = (var3 + p_cal[1] * var1) / 524288.0
+    var1 = (1.0 + var1 / 32768.0) * p_cal[0]
+    if not var1:
+        raise ArithmeticError("Invalid BME280 calibration data")
+    pressure = 1048576.0 - adc_p
+    pressure = ((pressure - var2 / 4096.0) * 6250.0) / var1
+    var1 = p_cal[8] * pressure * pressure / 2147483648.0
+    var2 = pressure * p_cal[7] / 32768.0
+    pressure = (pressure + (var1 + var2 + p_cal[6]) / 16.0) / 100
+
+    # Humidity
+    var1 = t_fine - 76800.0
+    var2 = h_cal[3] * 64.0 + (h_cal[4] / 16384.0) * var1
+    var3 = adc_h - var2
+    var4 = h_cal[1] / 65536.0
+    var5 = 1.0 + (h_cal[2] / 67108864.0) * var1
+    var6 = 1.0 + (h_cal[5] / 67108864.0) * var1 * var5
+    var6 = var3 * var4 * (var5 * var6)
+    humidity = var6 * (1.0 - h_cal[0] * var6 / 524288.0)
+    humidity = min(max(humidity, 0.0), 100.0)
+
+    return temperature, humidity, pressure
+
+
+if NUMBA_AVAILABLE:
+    # ~40 float ops per reading; compiled once and cached in __pycache__
+    _compensate = njit(cache=True)(_compensate)
+
+
+def read_bme280_burst(bme280, calib=None):
+    """Read (temperature °C, humidity %, pressure hPa) in one I2C burst.
+
+    The adafruit properties re-read the temperature registers before each
+    channel, so three property accesses cost ~12 bus transactions. Here the
+    whole data block is read at once (a single smbus2 i2c_rdwr when that is
+    installed) and the datasheet compensation runs against the calibration
+    the driver already loaded (or ``calib`` from bme280_calibration).
+    """
+    t_cal, p_cal, h_cal = calib or bme280_calibration(bme280)
+    # Forced mode needs a conversion kicked off, same as the driver does
+    if bme280.mode != 0x03:
+        bme280.mode = 0x01
+        while bme280._get_status() & 0x08:
+            time.sleep(0.002)
+
+    address = getattr(getattr(bme280, '_i2c', None), 'device_address', None)
+    if SMBUS_AVAILABLE and address is not None:
+        buf = burst_read(address, BME280_DATA_REGISTER, BME280_DATA_LENGTH)
+    else:
+        buf = bme280._read_register(BME280_DATA_REGISTER, BME280_DATA_LENGTH)
+    adc_p = ((buf[0] << 16) | (buf[1] << 8) | buf[2]) >> 4
+    adc_t = ((buf[3] << 16) | (buf[4] << 8) | buf[5]) >> 4
+    adc_h = (buf[6] << 8) | buf[7]
+
+    return _compensate(adc_t, adc_p, adc_h, t_cal, p_cal, h_cal)
+
+
 class EnvSensor:
-    def __init__(self, address=0x76):
+    def __init__(self, address=0x76, ttl=READ_CACHE_TTL):
+        # Dashboard/API polls within ttl seconds share one bus transaction;
+        # pass ttl=0 to hit the sensor on every read()
+        self._ttl = ttl
+        # (monotonic publish time, reading) - one tuple so the two never tear
+        self._cache = None
+        self._calib = None
+        self._reader = None
+        self._reader_period = READER_PERIOD
+        self._stop_reader = threading.Event()
+        self._published = threading.Event()
         if HW_AVAILABLE:
             try:
                 i2c = busio.I2C(board.SCL, board.SDA)
                 self.bme280 = adafruit_bme280.Adafruit_BME280_I2C(i2c, address=address)
                 self.bme280.sea_level_pressure = 1013.25  # adjust if needed
+                self._calib = bme280_calibration(self.bme280)
             except Exception as e:
-                logging.error(f"BME280 initialization failed: {e}")
+                logging.error("BME280 initialization failed: %s", e)
                 self.bme280 = None
         else:
             self.bme280 = None
@@ -26,9 +147,80 @@ class EnvSensor:
     def read(self):
         if not self.bme280:
             # Return mock data in dev, None in prod if not available
-            return {"temperature": 22.0, "humidity": 50.0, "pressure": 1012.0} if not HW_AVAILABLE else {"temperature": None, "humidity": None, "pressure": None}
-        return {
-            "temperature": round(self.bme280.temperature, 1),
-            "humidity": round(self.bme280.humidity, 1),
-            "pressure": round(self.bme280.pressure, 1)
+            return {"temperature": 22.0, "humidity": 50.0, "pressure": 1012.0} if not HW_AVAILABLE else dict(NO_READING)
+        if self._reader is not None and not self._stop_reader.is_set():
+            return self._read_published()
+        cache = self._cache
+        if cache is not None and time.monotonic() - cache[0] < self._ttl:
+            return dict(cache[1])
+        return dict(self._refresh())
+
+    def _read_published(self):
+        """Latest reading from the background reader, never touching the bus.
+
+        Waits for the first publish rather than reading from the caller's
+        thread, and reports NO_READING once the slot has gone stale (the
+        reader logs the bus errors that caused it).
+        """
+        max_age = self._reader_period * READER_STALE_PERIODS
+        if not self._published.wait(timeout=max_age):
+            return dict(NO_READING)
+        published_at, reading = self._cache
+        if time.monotonic() - published_at > max_age:
+            return dict(NO_READING)
+        return dict(reading)
+
+    def start(self, period=READER_PERIOD):
+        """Read the sensor every period seconds on a background thread.
+
+        read() then just copies the latest published reading, so any number
+        of callers never wait on I2C. No-op without a sensor or if running.
+        """
+        if not self.bme280:
+            return
+        reader = self._reader
+        if reader is not None:
+            if reader.is_alive():
+                # Running, or a stop() whose join timed out is still winding
+                # down - never run a second reader alongside it
+                return
+            self._reader = None
+        self._reader_period = period
+        self._stop_reader.clear()
+        self._reader = threading.Thread(target=self._reader_loop, args=(period,),
+                                        name='env-sensor', daemon=True)
+        self._reader.start()
+
+    def stop(self):
+        """Stop the background reader; read() goes back to on-demand reads"""
+        reader = self._reader
+        if reader is None:
+            return
+        self._stop_reader.set()
+        reader.join(timeout=2.0)
+        if reader.is_alive():
+            # Stuck in an I2C transfer; it exits on its next loop check.
+            # Keep the reference so start() can't launch a second reader.
+            logging.warning("BME280 reader thread did not stop within 2s")
+            return
+        self._reader = None
+
+    def _reader_loop(self, period):
+        while not self._stop_reader.is_set():
+            try:
+                self._refresh()
+            except Exception as e:
+                logging.error("BME280 read failed: %s", e)
+            self._stop_reader.wait(period)
+
+    def _refresh(self):
+        temperature, humidity, pressure = read_bme280_burst(self.bme280, self._calib)
+        reading = {
+            "temperature": round(temperature, 1),
+            "humidity": round(humidity, 1),
+            "pressure": round(pressure, 1)
         }
+        # A single reference assignment, so readers see the old or new slot whole
+        self._cache = (time.monotonic(), reading)
+        self._published.set()
+        return reading
@@ -0,0 +1,85 @@
+# utils/i2c_bus.py
+"""Shared helpers for poking at the Pi's I2C bus from the sensor scripts."""
+
+import re
+import time
+import subprocess
+try:
+    from smbus2 import SMBus, i2c_msg
+    SMBUS_AVAILABLE = True
+except ImportError:
+    SMBUS_AVAILABLE = False
+
+_i2c_scan_cache = {}
+_i2c_addresses_cache = {}
+_buses = {}
+
+
+def i2c_scan(bus=1, ttl=2.0):
+    """Run ``i2cdetect -y <bus>`` and memoize the result for ``ttl`` seconds.
+
+    Each scan forks i2cdetect and takes ~100 ms; the test menus hit it from
+    several places in one run, so they all share a single result. Raises
+    FileNotFoundError if i2c-tools is not installed, like subprocess.run.
+    """
+    now = time.monotonic()
+    cached = _i2c_scan_cache.get(bus)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+
+    result = subprocess.run(['i2cdetect', '-y', str(bus)],
+                            capture_output=True, text=True, check=False)
+    _i2c_scan_cache[bus] = (now, result)
+    return result
+
+
+# One row of the i2cdetect table ("70: -- -- 76 UU ...") and the occupied
+# cells within it; compiled once so each scan is a single regex pass
+_I2CDETECT_ROW = re.compile(r'^([0-9a-f]0):(.*)$', re.MULTILINE)
+_I2CDETECT_CELL = re.compile(r'[0-9a-f]{2}|UU')
+
+
+def _parse_i2cdetect(output):
+    """Addresses present in an ``i2cdetect`` table (``UU`` counts as present)."""
+    addresses = set()
+    for row in _I2CDETECT_ROW.finditer(output):
+        base = int(row.group(1), 16)
+        for cell in _I2CDETECT_CELL.finditer(row.group(2)):
+            if cell.group() == 'UU':
+                # Cells are fixed-width " xx", so the offset gives the column
+                addresses.add(base + cell.start() // 3)
+            else:
+                addresses.add(int(cell.group(), 16))
+    return frozenset(addresses)
+
+
+def i2c_addresses(bus=1, ttl=2.0):
+    """Return the set of addresses answering on ``bus`` as ints.
+
+    Built on the memoized i2c_scan() and parsed once per scan, so checks
+    like ``0x76 in i2c_addresses()`` are set lookups rather than substring
+    searches over the table (which also match the row headers). Returns an
+    empty set if the scan failed.
+    """
+    result = i2c_scan(bus, ttl)
+    parsed = _i2c_addresses_cache.get(bus)
+    if parsed is None or parsed[0] is not result:
+        addresses = _parse_i2cdetect(result.stdout) if result.returncode == 0 else frozenset()
+        parsed = _i2c_addresses_cache[bus] = (result, addresses)
+    return parsed[1]
+
+
+def burst_read(addr, reg, n, bus=1):
+    """Read ``n`` bytes starting at register ``reg`` of device ``addr``.
+
+    The register write and the read go to the kernel as one i2c_rdwr call,
+    so the driver issues them back-to-back with a repeated start instead of
+    one Python round-trip per byte. The SMBus handle is kept open per bus.
+    """
+    smbus = _buses.get(bus)
+    if smbus is None:
+        smbus = _buses[bus] = SMBus(bus)
+    write = i2c_msg.write(addr, [reg])
+    read = i2c_msg.read(addr, n)
+    smbus.i2c_rdwr(write, read)
+    return list(read)
@@ -0,0 +1,25 @@
+# utils/lazy_import.py
+"""Load optional hardware libraries on first use, at most once per process."""
+
+import importlib
+
+_modules = {}
+
+
+def lazy_import(name):
+    """Import ``name`` on first call and return the cached module after that.
+
+    Failed imports are remembered too, so a missing library is not searched
+    for on sys.path again every time a menu option is re-run; the ImportError
+    is raised again instead.
+    """
+    module = _modules.get(name)
+    if module is None:
+        try:
+            module = importlib.import_module(name)
+        except ImportError as e:
+            module = e
+        _modules[name] = module
+    if isinstance(module, ImportError):
+        raise ImportError(str(module))
+    return module